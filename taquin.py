@@ -4,40 +4,792 @@ import heapq
 import time
 import random
 import threading
-from typing import List, Tuple, Optional, Dict, Union, Any
+import queue
+import argparse
+import json
+import dbm
+import mmap
+import multiprocessing
+import os
+import struct
+import sys
+import warnings
+from array import array
+from collections import OrderedDict
+from concurrent.futures import (
+    FIRST_COMPLETED,
+    ProcessPoolExecutor,
+    as_completed,
+    wait,
+)
+from typing import (
+    List,
+    Tuple,
+    Optional,
+    Dict,
+    Union,
+    Any,
+    Callable,
+    Iterable,
+    Iterator,
+    Set,
+)
+
+try:
+    import resource  # Pic de RSS du banc d'essai (absent sous Windows)
+except ImportError:
+    resource = None  # type: ignore[assignment]
 
 # Type alias pour la clarté
 State = Tuple[Tuple[int, ...], ...]
 
+# Déplacements du vide par code de coup (0 haut, 1 bas, 2 gauche, 3 droite) et
+# lettre correspondante dans le format compact des solutions
+_MOVE_DELTAS = ((-1, 0), (1, 0), (0, -1), (0, 1))
+MOVE_LETTERS = "UDLR"
 
-class TaquinSolver:
+# Heuristiques additives par tuile : h = somme des coûts de chaque tuile selon
+# sa case et sa case cible. Un coup ne déplace qu'une tuile, donc h se met à
+# jour en O(1) ; toute nouvelle heuristique de cette forme s'ajoute ici.
+_TILE_COSTS: Dict[str, Callable[[int, int, int], int]] = {
+    "manhattan": lambda cols, cell, target: (
+        abs(cell // cols - target // cols) + abs(cell % cols - target % cols)
+    ),
+    "misplaced": lambda cols, cell, target: int(cell != target),
+}
+
+
+def _tile_table(
+    heuristic: str, cols: int, targets: List[int]
+) -> Tuple[Tuple[int, ...], ...]:
+    # table[tuile][case] : coût de la tuile sur la case (le vide ne compte pas)
+    cost = _TILE_COSTS[heuristic]
+    cells = len(targets)
+    return tuple(
+        tuple(0 if tile == 0 else cost(cols, k, targets[tile]) for k in range(cells))
+        for tile in range(cells)
+    )
+
+
+class _Board:
+    # Tables propres à une taille de grille, construites une fois (voir _board).
+    # Encodage compact : case k = ligne * cols + colonne, stockée sur `bits`
+    # bits à partir du bit k * bits.
+    def __init__(self, rows: int, cols: int) -> None:
+        self.rows, self.cols = rows, cols
+        self.cells = rows * cols
+        self.bits = max(4, (self.cells - 1).bit_length())
+        self.mask = (1 << self.bits) - 1
+        self.shifts: Tuple[int, ...] = tuple(k * self.bits for k in range(self.cells))
+        self.neighbors: Tuple[Tuple[int, ...], ...] = tuple(
+            tuple(
+                (r + dr) * cols + (c + dc)
+                for dr, dc in _MOVE_DELTAS
+                if 0 <= r + dr < rows and 0 <= c + dc < cols
+            )
+            for r in range(rows)
+            for c in range(cols)
+        )
+        # Même ordre que neighbors, avec le code du coup (0 haut, 1 bas,
+        # 2 gauche, 3 droite) ; offsets[code] = déplacement du vide
+        self.offsets: Tuple[int, ...] = (-cols, cols, -1, 1)
+        self.moves: Tuple[Tuple[Tuple[int, int], ...], ...] = tuple(
+            tuple(
+                (k + self.offsets[code], code)
+                for code, (dr, dc) in enumerate(_MOVE_DELTAS)
+                if 0 <= k // cols + dr < rows and 0 <= k % cols + dc < cols
+            )
+            for k in range(self.cells)
+        )
+        self.goal_state: State = tuple(
+            tuple((r * cols + c + 1) % self.cells for c in range(cols))
+            for r in range(rows)
+        )
+        # Case cible de chaque tuile (le vide termine en bas à droite)
+        self.goal_positions = [(tile - 1) % self.cells for tile in range(self.cells)]
+        self.tables: Dict[str, Tuple[Tuple[int, ...], ...]] = {
+            name: _tile_table(name, cols, self.goal_positions) for name in _TILE_COSTS
+        }
+
+    def pack(self, state: State) -> Tuple[int, int]:
+        packed, blank = 0, -1
+        for k, val in enumerate(v for row in state for v in row):
+            packed |= val << self.shifts[k]
+            if val == 0:
+                blank = k
+        return packed, blank
+
+    def unpack(self, packed: int) -> State:
+        flat = [(packed >> shift) & self.mask for shift in self.shifts]
+        cols = self.cols
+        return tuple(tuple(flat[i * cols : i * cols + cols]) for i in range(self.rows))
+
+
+_BOARDS: Dict[Tuple[int, int], _Board] = {}
+
+
+def _board(rows: int, cols: int) -> _Board:
+    if (rows, cols) not in _BOARDS:
+        _BOARDS[(rows, cols)] = _Board(rows, cols)
+    return _BOARDS[(rows, cols)]
+
+
+_NO_MOVE = 4  # Code « pas de parent » (état de départ)
+_OPEN_ENTRY_BYTES = 150  # Estimation d'une entrée de la file (tuple + entiers)
+_DICT_ENTRY_BYTES = 100  # Estimation d'un état dans les dictionnaires g + parent
+_ARA_WEIGHT_STEP = 0.5  # Baisse du poids entre deux itérations d'ARA*
+# Résultats d'une itération d'IDA* (sinon : prochaine borne)
+_FOUND, _ABORTED, _NO_BOUND = -1, -2, 1 << 30
+_PARALLEL_FRONTIER = 2000  # Nœuds de frontière à répartir entre les processus
+_PARALLEL_CHUNKS = 8  # Lots par processus : équilibre la charge entre seuils
+
+
+def _memory_message(memory_limit: float) -> str:
+    return f"Limite mémoire atteinte ({memory_limit / (1024 * 1024):g} Mo)."
+
+
+class _StateTable:
+    # Ensemble fermé compact : adressage ouvert à sondage linéaire sur les
+    # états compacts. Par case : la clé (0 = libre, aucun état valide ne vaut
+    # 0), g sur 16 bits et le code du coup qui y mène au lieu de l'état parent.
+    def __init__(self, key_bits: int, capacity: int = 1 << 16) -> None:
+        # Au-delà de 64 bits (5×5 et plus) les clés restent des entiers Python
+        self._wide = key_bits > 64
+        self._allocate(capacity)
+
+    def _allocate(self, capacity: int) -> None:
+        self.capacity = capacity
+        self._mask = capacity - 1
+        self._shift = 64 - capacity.bit_length() + 1
+        self.keys: Any = (
+            [0] * capacity if self._wide else array("Q", bytes(8 * capacity))
+        )
+        self.g = array("H", bytes(2 * capacity))
+        self.moves = bytearray(capacity)
+        self.size = 0
+
+    @property
+    def nbytes(self) -> int:
+        return self.capacity * (8 + 2 + 1)
+
+    def slot(self, key: int) -> int:
+        # Hachage multiplicatif de Fibonacci (bits du milieu du produit)
+        keys, mask = self.keys, self._mask
+        i = ((key * 0x9E3779B97F4A7C15) >> self._shift) & mask
+        k = keys[i]
+        while k != key and k != 0:
+            i = (i + 1) & mask
+            k = keys[i]
+        return i
+
+    def put(self, slot: int, key: int, g: int, move: int) -> None:
+        if self.keys[slot] == 0:
+            self.size += 1
+        self.keys[slot] = key
+        self.g[slot] = g
+        self.moves[slot] = move
+        if self.size * 3 > self.capacity * 2:
+            self._grow()
+
+    def _grow(self) -> None:
+        keys, g_values, moves = self.keys, self.g, self.moves
+        self._allocate(self.capacity * 2)
+        for i, key in enumerate(keys):
+            if key:
+                slot = self.slot(key)
+                self.keys[slot] = key
+                self.g[slot] = g_values[i]
+                self.moves[slot] = moves[i]
+                self.size += 1
+
+
+# Entrée de file ouverte : (f, g, h, état, vide, aux)
+OpenEntry = Tuple[Any, int, int, int, int, int]
+
+
+class _BucketQueue:
+    # File ouverte pour f entier (A* simple) : un seau par valeur de f, et dans
+    # chaque seau une pile par g. On sort le plus petit f puis le plus grand g
+    # (le nœud le plus profond) ; push et pop en O(1) amorti.
+    def __init__(self) -> None:
+        self._buckets: List[List[List[OpenEntry]]] = []
+        self._top_g: List[int] = []
+        self._counts: List[int] = []
+        self._f_min = 0
+        self._size = 0
+
+    def __len__(self) -> int:
+        return self._size
+
+    def push(self, entry: OpenEntry) -> None:
+        f, g = entry[0], entry[1]
+        buckets = self._buckets
+        while len(buckets) <= f:
+            buckets.append([])
+            self._top_g.append(-1)
+            self._counts.append(0)
+        stacks = buckets[f]
+        while len(stacks) <= g:
+            stacks.append([])
+        stacks[g].append(entry)
+        if g > self._top_g[f]:
+            self._top_g[f] = g
+        if f < self._f_min:
+            self._f_min = f
+        self._counts[f] += 1
+        self._size += 1
+
+    def min_key(self) -> int:
+        # Plus petit f présent, entrées périmées comprises (file non vide)
+        counts = self._counts
+        f = self._f_min
+        while counts[f] == 0:
+            f += 1
+        self._f_min = f
+        return f
+
+    def pop(self) -> OpenEntry:
+        counts = self._counts
+        f = self._f_min
+        while counts[f] == 0:
+            f += 1
+        self._f_min = f
+        stacks = self._buckets[f]
+        g = self._top_g[f]
+        while not stacks[g]:
+            g -= 1
+        self._top_g[f] = g
+        counts[f] -= 1
+        self._size -= 1
+        return stacks[g].pop()
+
+
+class _HeapQueue:
+    # Repli pour f réel (A* pondéré) : tas binaire, même interface
+    def __init__(self) -> None:
+        self._heap: List[OpenEntry] = []
+
+    def __len__(self) -> int:
+        return len(self._heap)
+
+    def push(self, entry: OpenEntry) -> None:
+        heapq.heappush(self._heap, entry)
+
+    def pop(self) -> OpenEntry:
+        return heapq.heappop(self._heap)
+
+
+def _lowest(counts: List[int]) -> int:
+    # Plus petite valeur présente dans un histogramme non vide
+    value = 0
+    while counts[value] == 0:
+        value += 1
+    return value
+
+
+# Raccourcis 4×4 pour les heuristiques propres au taquin 15 (LC, WD, PDB)
+_BOARD_4X4 = _board(4, 4)
+_NEIGHBORS = _BOARD_4X4.neighbors
+_MANHATTAN = _BOARD_4X4.tables["manhattan"]
+
+
+# Case k -> case de la grille transposée (lecture colonne par colonne)
+_TRANSPOSE: Tuple[int, ...] = tuple((k % 4) * 4 + k // 4 for k in range(16))
+
+
+# --- Conflits linéaires et walking distance ---
+
+
+def _line_conflicts(keys: List[int]) -> int:
+    # Tuiles à retirer de la ligne pour que les autres soient dans l'ordre du
+    # but (longueur moins plus longue sous-suite croissante) ; chacune coûte
+    # au moins deux coups de plus que Manhattan.
+    best: List[int] = []
+    for i, key in enumerate(keys):
+        best.append(1 + max((best[j] for j in range(i) if keys[j] < key), default=0))
+    return len(keys) - max(best, default=0)
+
+
+def _conflict_tables(by_row: bool) -> Tuple[bytes, ...]:
+    # tables[ligne][contenu 16 bits de la ligne] = 2 × conflits (déjà doublés)
+    tables = []
+    for line in range(4):
+        cache: Dict[Tuple[int, ...], int] = {}
+        values = bytearray(1 << 16)
+        for packed_line in range(1 << 16):
+            keys = []
+            for i in range(4):
+                tile = (packed_line >> (i << 2)) & 0xF
+                if tile == 0:
+                    continue
+                goal_line, goal_pos = divmod(tile - 1, 4)
+                if not by_row:
+                    goal_line, goal_pos = goal_pos, goal_line
+                if goal_line == line:
+                    keys.append(goal_pos)
+            pattern = tuple(keys)
+            if pattern not in cache:
+                cache[pattern] = 2 * _line_conflicts(keys)
+            values[packed_line] = cache[pattern]
+        tables.append(bytes(values))
+    return tuple(tables)
+
+
+def _renamed_lines(table: bytes, names: List[int]) -> bytes:
+    # Table indexée par le contenu d'une ligne, relue après avoir renommé
+    # chaque tuile v en names[v] (deux tuiles par octet)
+    pairs = [names[b & 0xF] | names[b >> 4] << 4 for b in range(256)]
+    return bytes(table[low | high << 8] for high in pairs for low in pairs)
+
+
+class LinearConflict:
+    # h = Manhattan + 2 × conflits de chaque ligne et colonne. aux est l'état
+    # transposé, pour lire une colonne d'un seul décalage comme une ligne.
     def __init__(self) -> None:
-        self.goal_state: State = (
-            (1, 2, 3, 4),
-            (5, 6, 7, 8),
-            (9, 10, 11, 12),
-            (13, 14, 15, 0),
+        self._md = _MANHATTAN
+        self._rows = _conflict_tables(by_row=True)
+        self._cols = _conflict_tables(by_row=False)
+
+    def towards(self, targets: List[int]) -> "LinearConflict":
+        # Même heuristique vers une cible quelconque (targets[tuile] = case).
+        # Chaque tuile prend le nom de celle qui vise la même case dans le but,
+        # et les tables se relisent à travers ce renommage. La tuile qui vise
+        # la case du vide du but n'a pas d'équivalent : on ignore ses conflits,
+        # ce qui ne peut que baisser h.
+        names = [0] + [0 if targets[t] == 15 else targets[t] + 1 for t in range(1, 16)]
+        model = LinearConflict.__new__(LinearConflict)
+        model._md = _tile_table("manhattan", 4, targets)
+        model._rows = tuple(_renamed_lines(table, names) for table in self._rows)
+        model._cols = tuple(_renamed_lines(table, names) for table in self._cols)
+        return model
+
+    def initial(self, packed: int) -> Tuple[int, int]:
+        aux = 0
+        h = 0
+        md = self._md
+        for k in range(16):
+            tile = (packed >> (k << 2)) & 0xF
+            aux |= tile << (_TRANSPOSE[k] << 2)
+            h += md[tile][k]
+        for line in range(4):
+            h += self._rows[line][(packed >> (line << 4)) & 0xFFFF]
+            h += self._cols[line][(aux >> (line << 4)) & 0xFFFF]
+        return h, aux
+
+    def step(
+        self, h: int, aux: int, current: int, tile: int, src: int, dst: int
+    ) -> Tuple[int, int]:
+        md = self._md[tile]
+        h += md[dst] - md[src]
+        new_aux = (
+            aux + (tile << (_TRANSPOSE[dst] << 2)) - (tile << (_TRANSPOSE[src] << 2))
+        )
+        # Un coup horizontal ne change l'ordre d'aucune ligne : seules les deux
+        # colonnes concernées sont réévaluées (et réciproquement).
+        if src >> 2 == dst >> 2:
+            cols = self._cols
+            for c in (src & 3, dst & 3):
+                shift = c << 4
+                h += cols[c][(new_aux >> shift) & 0xFFFF]
+                h -= cols[c][(aux >> shift) & 0xFFFF]
+        else:
+            rows = self._rows
+            neighbor = current + (tile << (dst << 2)) - (tile << (src << 2))
+            for r in (src >> 2, dst >> 2):
+                shift = r << 4
+                h += rows[r][(neighbor >> shift) & 0xFFFF]
+                h -= rows[r][(current >> shift) & 0xFFFF]
+        return h, new_aux
+
+
+_WALKING_TABLES: Dict[int, Tuple[Dict[Any, int], List[int], List[int]]] = {}
+
+
+def _walking_tables(blank_line: int) -> Tuple[Dict[Any, int], List[int], List[int]]:
+    # BFS de l'abstraction par lignes depuis sa configuration cible (4 tuiles
+    # de chaque ligne chez elles, 3 et le vide sur blank_line) : identifiants,
+    # distances et transitions [id * 8 + (sens bas) * 4 + ligne cible]
+    if blank_line in _WALKING_TABLES:
+        return _WALKING_TABLES[blank_line]
+    goal = tuple(
+        tuple(4 - (r == blank_line) if g == r else 0 for g in range(4))
+        for r in range(4)
+    )
+    start = (goal, blank_line)
+    ids: Dict[Any, int] = {start: 0}
+    states = [start]
+    distances = [0]
+    transitions: List[int] = []
+    i = 0
+    while i < len(states):
+        counts, blank = states[i]
+        moves = [-1] * 8
+        for direction, d in enumerate((-1, 1)):
+            other = blank + d
+            if not 0 <= other < 4:
+                continue
+            for g in range(4):
+                if counts[other][g] == 0:
+                    continue
+                rows = [list(row) for row in counts]
+                rows[other][g] -= 1
+                rows[blank][g] += 1
+                key = (tuple(tuple(row) for row in rows), other)
+                if key not in ids:
+                    ids[key] = len(states)
+                    states.append(key)
+                    distances.append(distances[i] + 1)
+                moves[direction * 4 + g] = ids[key]
+        transitions.extend(moves)
+        i += 1
+    _WALKING_TABLES[blank_line] = (ids, distances, transitions)
+    return ids, distances, transitions
+
+
+class WalkingDistance:
+    # Abstraction par lignes : on ne retient que le nombre de tuiles de chaque
+    # ligne cible présentes dans chaque ligne, plus la ligne du vide. Distances
+    # et transitions sont précalculées par BFS ; les colonnes se traitent
+    # comme les lignes de la grille transposée. aux = id_lignes | id_colonnes
+    # << 16. targets[tuile] = case cible (défaut : le but, vide compris).
+    def __init__(self, targets: Optional[List[int]] = None) -> None:
+        if targets is None:
+            targets = _BOARD_4X4.goal_positions
+        self._row_ids, self._row_distances, self._row_transitions = (
+            _walking_tables(targets[0] >> 2)
+        )
+        self._col_ids, self._col_distances, self._col_transitions = (
+            _walking_tables(targets[0] & 3)
+        )
+        self._target_rows = bytes(cell >> 2 for cell in targets)
+        self._target_cols = bytes(cell & 3 for cell in targets)
+
+    def towards(self, targets: List[int]) -> "WalkingDistance":
+        return WalkingDistance(targets)
+
+    def _line_id(self, packed: int, by_row: bool) -> int:
+        counts = [[0] * 4 for _ in range(4)]
+        blank = 0
+        targets = self._target_rows if by_row else self._target_cols
+        for k in range(16):
+            tile = (packed >> (k << 2)) & 0xF
+            line = k >> 2 if by_row else k & 3
+            if tile == 0:
+                blank = line
+            else:
+                counts[line][targets[tile]] += 1
+        ids = self._row_ids if by_row else self._col_ids
+        return ids[(tuple(tuple(row) for row in counts), blank)]
+
+    def initial(self, packed: int) -> Tuple[int, int]:
+        row_id = self._line_id(packed, by_row=True)
+        col_id = self._line_id(packed, by_row=False)
+        return (
+            self._row_distances[row_id] + self._col_distances[col_id],
+            row_id | col_id << 16,
+        )
+
+    def step(
+        self, h: int, aux: int, current: int, tile: int, src: int, dst: int
+    ) -> Tuple[int, int]:
+        # Le vide va de dst vers src ; un coup vertical ne touche que
+        # l'abstraction des lignes, un coup horizontal celle des colonnes.
+        row_id, col_id = aux & 0xFFFF, aux >> 16
+        direction = 4 if src > dst else 0
+        if src >> 2 == dst >> 2:
+            col_id = self._col_transitions[
+                (col_id << 3) + direction + self._target_cols[tile]
+            ]
+        else:
+            row_id = self._row_transitions[
+                (row_id << 3) + direction + self._target_rows[tile]
+            ]
+        return (
+            self._row_distances[row_id] + self._col_distances[col_id],
+            row_id | col_id << 16,
+        )
+
+
+# --- Bases de motifs additives (PDB) ---
+
+# Motifs disjoints : le coût d'un motif ne compte que les coups de ses propres
+# tuiles, les valeurs des différents motifs s'additionnent donc sans perdre
+# l'admissibilité.
+PDB_PARTITIONS: Dict[str, Tuple[Tuple[int, ...], ...]] = {
+    "6-6-3": ((1, 5, 6, 9, 10, 13), (7, 8, 11, 12, 14, 15), (2, 3, 4)),
+    "5-5-5": ((1, 2, 3, 5, 6), (4, 7, 8, 11, 12), (9, 10, 13, 14, 15)),
+}
+PDB_DEFAULT_PATH = os.path.join(
+    os.path.dirname(os.path.abspath(__file__)), "taquin.pdb"
+)
+_PDB_MAGIC = b"TAQUINPDB1"
+# Index creux en base 16 (position de chaque tuile dans un quartet) : un coup
+# modifie l'index en O(1), au prix de 16^k octets par motif de k tuiles.
+_PDB_MAX_TILES = 6
+
+
+def parse_partition(spec: str) -> Tuple[Tuple[int, ...], ...]:
+    # Nom prédéfini ("6-6-3") ou motifs explicites ("1,2,3/4,5,6/...")
+    if spec in PDB_PARTITIONS:
+        return PDB_PARTITIONS[spec]
+    try:
+        partition = tuple(
+            tuple(int(t) for t in group.split(",")) for group in spec.split("/")
+        )
+    except ValueError:
+        raise ValueError(f"Partition invalide : {spec!r}")
+    tiles = sorted(t for group in partition for t in group)
+    if tiles != list(range(1, 16)):
+        raise ValueError("Les motifs doivent couvrir les tuiles 1 à 15 sans doublon.")
+    if any(len(group) > _PDB_MAX_TILES for group in partition):
+        raise ValueError(f"Un motif contient au plus {_PDB_MAX_TILES} tuiles.")
+    return partition
+
+
+def _build_pattern_table(pattern: Tuple[int, ...]) -> bytearray:
+    # Parcours en largeur par couches de coût. Les tuiles hors motif sont
+    # indiscernables : le vide parcourt librement sa région (coût 0), seul le
+    # déplacement d'une tuile du motif coûte 1.
+    k = len(pattern)
+    size = 16**k
+    table = bytearray(b"\xff") * size
+    # Bits 0-15 : cases déjà couvertes par le vide ; bits 16-31 : couples
+    # (index, vide) déjà mis en couche
+    marks = array("I", bytes(4 * size))
+    # Une couche est un tableau d'entiers index << 4 | vide, sans doublon :
+    # 8 octets par entrée au lieu d'un tuple, pour tenir 6 tuiles en mémoire
+    start = sum((t - 1) << (i << 2) for i, t in enumerate(pattern))
+    layer = array("Q", [start << 4 | 15])
+    cost = 0
+    while layer:
+        next_layer = array("Q")
+        for entry in layer:
+            idx, blank = entry >> 4, entry & 0xF
+            if marks[idx] >> blank & 1:
+                continue
+            positions = [(idx >> (i << 2)) & 0xF for i in range(k)]
+            free = 0xFFFF
+            for pos in positions:
+                free ^= 1 << pos
+
+            # Remplissage par masques : toute la frontière avance d'un pas
+            region = 1 << blank
+            while True:
+                grown = region | free & (
+                    (region << 1) & 0xEEEE
+                    | (region >> 1) & 0x7777
+                    | region << 4
+                    | region >> 4
+                )
+                if grown == region:
+                    break
+                region = grown
+            marks[idx] |= region
+            if table[idx] == 0xFF:
+                table[idx] = cost
+
+            for i, pos in enumerate(positions):
+                for nb in _NEIGHBORS[pos]:
+                    if region >> nb & 1:
+                        new_idx = idx + ((nb - pos) << (i << 2))
+                        if not marks[new_idx] >> pos & 0x10001:
+                            marks[new_idx] |= 0x10000 << pos
+                            next_layer.append(new_idx << 4 | pos)
+        layer = next_layer
+        cost += 1
+    return table
+
+
+def build_pattern_database(
+    spec: str,
+    path: str,
+    progress: Optional[Callable[[Dict[str, Any]], None]] = None,
+) -> None:
+    # progress reçoit {"pattern", "index", "total", "time"} après chaque motif
+    partition = parse_partition(spec)
+    header = json.dumps({"patterns": partition}).encode()
+    tmp_path = path + ".tmp"
+    with open(tmp_path, "wb") as f:
+        f.write(_PDB_MAGIC + struct.pack("<I", len(header)) + header)
+        for index, pattern in enumerate(partition):
+            start_time = time.time()
+            f.write(_build_pattern_table(pattern))
+            if progress is not None:
+                progress(
+                    {
+                        "pattern": pattern,
+                        "index": index,
+                        "total": len(partition),
+                        "time": time.time() - start_time,
+                    }
+                )
+    # Remplacement atomique : les solveurs en cours gardent l'ancien mapping
+    os.replace(tmp_path, path)
+
+
+class PatternDatabase:
+    # Tables chargées par mmap : les processus solveurs partagent les pages
+    # du cache système et le chargement est instantané.
+    def __init__(self, path: str) -> None:
+        with open(path, "rb") as f:
+            self._mm = mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ)
+        if self._mm[: len(_PDB_MAGIC)] != _PDB_MAGIC:
+            self._mm.close()
+            raise ValueError(f"Fichier PDB invalide : {path}")
+        offset = len(_PDB_MAGIC)
+        (header_len,) = struct.unpack_from("<I", self._mm, offset)
+        offset += 4
+        header = json.loads(self._mm[offset : offset + header_len])
+        offset += header_len
+
+        self.partition: Tuple[Tuple[int, ...], ...] = tuple(
+            tuple(group) for group in header["patterns"]
+        )
+        # La clé auxiliaire juxtapose les positions des tuiles, motif par motif.
+        # _tile_info[tuile] = (poids dans la clé, décalage, masque, table)
+        view = memoryview(self._mm)
+        self._tables: List[Tuple[int, int, memoryview]] = []
+        self._tile_info: List[Any] = [None] * 16
+        slot = 0
+        for pattern in self.partition:
+            size = 16 ** len(pattern)
+            entry = (slot << 2, size - 1, view[offset : offset + size])
+            self._tables.append(entry)
+            for i, tile in enumerate(pattern):
+                self._tile_info[tile] = (1 << ((slot + i) << 2),) + entry
+            offset += size
+            slot += len(pattern)
+
+    def initial(self, packed: int) -> Tuple[int, int]:
+        aux = 0
+        for k in range(16):
+            tile = (packed >> (k << 2)) & 0xF
+            if tile:
+                aux += k * self._tile_info[tile][0]
+        h = sum(table[(aux >> shift) & mask] for shift, mask, table in self._tables)
+        return h, aux
+
+    def step(
+        self, h: int, aux: int, current: int, tile: int, src: int, dst: int
+    ) -> Tuple[int, int]:
+        # Seul le motif de la tuile déplacée change d'index
+        weight, shift, mask, table = self._tile_info[tile]
+        new_aux = aux + (dst - src) * weight
+        return (
+            h - table[(aux >> shift) & mask] + table[(new_aux >> shift) & mask],
+            new_aux,
+        )
+
+
+# --- Cache de solutions ---
+
+CACHE_DEFAULT_PATH = os.path.join(
+    os.path.dirname(os.path.abspath(__file__)), "taquin.cache"
+)
+_CACHE_RECORD = struct.Struct("<HB")  # distance optimale, coup suivant
+# Algorithmes dont la solution est optimale : seuls eux alimentent le cache
+_OPTIMAL_ALGORITHMS = frozenset(
+    {"astar", "idastar", "parallel_idastar", "bidirectional"}
+)
+# Mémoire en O(profondeur) : memory_limit_mb ne les concerne pas
+_LINEAR_MEMORY_ALGORITHMS = frozenset({"idastar", "parallel_idastar"})
+
+
+class SolutionCache:
+    # État compacté -> (distance optimale, code du coup suivant du vide).
+    # LRU en mémoire devant une base dbm facultative : les évictions ne
+    # touchent que la mémoire, le disque garde tout.
+    def __init__(self, capacity: int = 100_000, path: Optional[str] = None) -> None:
+        self.capacity = capacity
+        self._entries: "OrderedDict[Tuple[int, int, int], Tuple[int, int]]" = (
+            OrderedDict()
         )
+        self._db: Any = dbm.open(path, "c") if path is not None else None
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+    def get(self, rows: int, cols: int, packed: int) -> Optional[Tuple[int, int]]:
+        key = (rows, cols, packed)
+        entry = self._entries.get(key)
+        if entry is not None:
+            self._entries.move_to_end(key)
+            return entry
+        if self._db is None:
+            return None
+        raw = self._db.get(f"{rows}x{cols}:{packed:x}")
+        if raw is None:
+            return None
+        entry = _CACHE_RECORD.unpack(raw)
+        self._remember(key, entry)
+        return entry
+
+    def put(self, rows: int, cols: int, packed: int, distance: int, move: int) -> None:
+        self._remember((rows, cols, packed), (distance, move))
+        if self._db is not None:
+            self._db[f"{rows}x{cols}:{packed:x}"] = _CACHE_RECORD.pack(distance, move)
+
+    def _remember(self, key: Tuple[int, int, int], entry: Tuple[int, int]) -> None:
+        self._entries[key] = entry
+        self._entries.move_to_end(key)
+        if len(self._entries) > self.capacity:
+            self._entries.popitem(last=False)
+
+    def flush(self) -> None:
+        # dbm.dumb n'écrit son index qu'au sync ; dbm.ndbm n'a pas de sync
+        sync = getattr(self._db, "sync", None)
+        if sync is not None:
+            sync()
+
+    def close(self) -> None:
+        if self._db is not None:
+            self._db.close()
+            self._db = None
+
+
+# Modèles sans fichier externe, construits une fois par processus
+_MODEL_FACTORIES: Dict[str, Any] = {
+    "linear_conflict": LinearConflict,
+    "walking_distance": WalkingDistance,
+}
+_MODELS: Dict[str, Any] = {}
+
+
+class TaquinSolver:
+    def __init__(
+        self,
+        pdb_path: Optional[str] = None,
+        rows: int = 4,
+        cols: int = 4,
+        cache: Optional[SolutionCache] = None,
+    ) -> None:
+        # Tables de la taille demandée, partagées entre solveurs
+        self._board = _board(rows, cols)
+        self.rows, self.cols = rows, cols
+        self.goal_state: State = self._board.goal_state
         self._abort: bool = False  # Drapeau pour arrêter le calcul
+        self.pdb_path: str = pdb_path or PDB_DEFAULT_PATH
+        self._pattern_db: Optional[PatternDatabase] = None  # Chargée à la demande
+        self.cache = cache  # Partageable entre solveurs de tailles différentes
 
     def request_stop(self) -> None:
         self._abort = True
 
     def manhattan_distance(self, state: State) -> int:
         distance = 0
-        for i in range(4):
-            for j in range(4):
+        for i in range(self.rows):
+            for j in range(self.cols):
                 val = state[i][j]
                 if val != 0:
-                    target_row, target_col = (val - 1) // 4, (val - 1) % 4
+                    target_row, target_col = divmod(val - 1, self.cols)
                     distance += abs(i - target_row) + abs(j - target_col)
         return distance
 
     def misplaced_tiles(self, state: State) -> int:
         return sum(
             1
-            for i in range(4)
-            for j in range(4)
+            for i in range(self.rows)
+            for j in range(self.cols)
             if state[i][j] != 0 and state[i][j] != self.goal_state[i][j]
         )
 
@@ -50,11 +802,15 @@ class TaquinSolver:
             if flat[i] > flat[j]
         )
 
+        # Largeur impaire : seule la parité des inversions compte
+        if self.cols % 2 == 1:
+            return inversions % 2 == 0
+
         # Trouver la ligne du vide (0) en partant du bas
         empty_row = -1
-        for i in range(4):
+        for i in range(self.rows):
             if 0 in state[i]:
-                empty_row = 4 - i
+                empty_row = self.rows - i
                 break
 
         if empty_row % 2 == 0:
@@ -62,31 +818,272 @@ class TaquinSolver:
         else:
             return inversions % 2 == 0
 
+    # --- Encodage compact : une case par groupe de bits dans un entier ---
+
+    def _pack(self, state: State) -> Tuple[int, int]:
+        return self._board.pack(state)
+
+    def _unpack(self, packed: int) -> State:
+        return self._board.unpack(packed)
+
+    def _packed_heuristic(
+        self, table: Tuple[Tuple[int, ...], ...], packed: int
+    ) -> int:
+        mask = self._board.mask
+        return sum(
+            table[(packed >> shift) & mask][k]
+            for k, shift in enumerate(self._board.shifts)
+        )
+
+    def _heuristic_model(self, heuristic: str) -> Any:
+        # Heuristiques non additives par tuile : objet exposant initial(état)
+        # -> (h, aux) et step(h, aux, état, tuile, départ, arrivée).
+        # Leurs tables sont propres au taquin 4×4.
+        if heuristic in _MODEL_FACTORIES or heuristic == "pdb":
+            if (self.rows, self.cols) != (4, 4):
+                raise ValueError(f"Heuristique {heuristic!r} réservée au 4×4.")
+        if heuristic == "pdb":
+            if self._pattern_db is None:
+                self._pattern_db = PatternDatabase(self.pdb_path)
+            return self._pattern_db
+        if heuristic in _MODEL_FACTORIES:
+            if heuristic not in _MODELS:
+                _MODELS[heuristic] = _MODEL_FACTORIES[heuristic]()
+            return _MODELS[heuristic]
+        raise ValueError(f"Heuristique inconnue : {heuristic!r}")
+
     def solve(
         self,
         start_state: State,
         heuristic: str = "manhattan",
         algorithm: str = "astar",
         weight: float = 1.5,
+        memory_limit_mb: Optional[float] = None,
+        progress: Optional[Callable[[Dict[str, Any]], None]] = None,
+        progress_every: int = 10000,
+        on_solution: Optional[Callable[[Dict[str, Any]], None]] = None,
+        time_limit: Optional[float] = None,
+        workers: Optional[int] = None,
+        as_moves: bool = False,
     ) -> Dict[str, Any]:
+        # Les états d'un chemin déjà en cache se résolvent sans recherche ;
+        # chaque solution optimale enrichit le cache de tous ses états.
+        # as_moves : "moves" (chaîne U/D/L/R du vide) remplace "path".
+        if self.cache is not None:
+            start_time = time.time()
+            moves = self._cached_moves(start_state)
+            if moves is not None:
+                cached: Dict[str, Any] = {
+                    "success": True,
+                    "nodes": 0,
+                    "time": (time.time() - start_time) * 1000,
+                    "cached": True,
+                }
+                if as_moves:
+                    cached["moves"] = moves
+                else:
+                    cached["path"] = self.moves_to_path(start_state, moves)
+                return cached
+        result = self._search(
+            start_state,
+            heuristic=heuristic,
+            algorithm=algorithm,
+            weight=weight,
+            memory_limit_mb=memory_limit_mb,
+            progress=progress,
+            progress_every=progress_every,
+            on_solution=on_solution,
+            time_limit=time_limit,
+            workers=workers,
+        )
+        if (
+            self.cache is not None
+            and result["success"]
+            and algorithm in _OPTIMAL_ALGORITHMS
+        ):
+            self._cache_path(result["path"])
+        if as_moves and result["success"]:
+            result["moves"] = self.path_to_moves(result.pop("path"))
+        return result
+
+    def path_to_moves(self, path: List[State]) -> str:
+        offsets = self._board.offsets
+        blanks = [self._pack(state)[1] for state in path]
+        return "".join(
+            MOVE_LETTERS[offsets.index(after - before)]
+            for before, after in zip(blanks, blanks[1:])
+        )
+
+    def moves_to_path(self, start_state: State, moves: str) -> List[State]:
+        board = self._board
+        current, blank = self._pack(start_state)
+        path = [current]
+        for letter in moves:
+            code = MOVE_LETTERS.find(letter)
+            nb = next((nb for nb, c in board.moves[blank] if c == code), None)
+            if nb is None:
+                raise ValueError(f"Coup impossible : {letter!r}")
+            tile = (current >> board.shifts[nb]) & board.mask
+            current += (tile << board.shifts[blank]) - (tile << board.shifts[nb])
+            blank = nb
+            path.append(current)
+        return [self._unpack(node) for node in path]
+
+    def _cached_moves(self, start_state: State) -> Optional[str]:
+        # Suit les coups en cache jusqu'au but ; None si un maillon manque
+        # (évincé du LRU) ou si l'état est inconnu.
+        board = self._board
+        assert self.cache is not None
+        current, blank = self._pack(start_state)
+        entry = self.cache.get(self.rows, self.cols, current)
+        if entry is None:
+            return None
+        moves = []
+        for _ in range(entry[0]):
+            entry = self.cache.get(self.rows, self.cols, current)
+            if entry is None or entry[1] == _NO_MOVE:
+                return None
+            nb = blank + board.offsets[entry[1]]
+            tile = (current >> board.shifts[nb]) & board.mask
+            current += (tile << board.shifts[blank]) - (tile << board.shifts[nb])
+            blank = nb
+            moves.append(MOVE_LETTERS[entry[1]])
+        return "".join(moves)
+
+    def _cache_path(self, path: List[State]) -> None:
+        assert self.cache is not None
+        offsets = self._board.offsets
+        packed = [self._pack(state) for state in path]
+        last = len(packed) - 1
+        for i, (node, blank) in enumerate(packed):
+            move = offsets.index(packed[i + 1][1] - blank) if i < last else _NO_MOVE
+            self.cache.put(self.rows, self.cols, node, last - i, move)
+        self.cache.flush()
+
+    def _search(
+        self,
+        start_state: State,
+        heuristic: str = "manhattan",
+        algorithm: str = "astar",
+        weight: float = 1.5,
+        memory_limit_mb: Optional[float] = None,
+        progress: Optional[Callable[[Dict[str, Any]], None]] = None,
+        progress_every: int = 10000,
+        on_solution: Optional[Callable[[Dict[str, Any]], None]] = None,
+        time_limit: Optional[float] = None,
+        workers: Optional[int] = None,
+    ) -> Dict[str, Any]:
+        # progress(métriques) est appelé toutes les progress_every expansions ;
+        # sans rappel, la boucle ne paie qu'un test sur None. En mode
+        # "anytime", on_solution reçoit chaque solution améliorée et
+        # time_limit (secondes) borne la recherche. En mode
+        # "parallel_idastar", workers fixe le nombre de processus.
 
         self._abort = False
+        if memory_limit_mb is not None and algorithm in _LINEAR_MEMORY_ALGORITHMS:
+            warnings.warn(
+                f"memory_limit_mb ignoré par {algorithm} (mémoire linéaire)",
+                RuntimeWarning,
+                stacklevel=3,
+            )
         if not self.is_solvable(start_state):
             return {"success": False, "message": "Configuration insoluble."}
-
-        open_set: List[Tuple[float, int, State]] = []
-        h_func = (
-            self.manhattan_distance
-            if heuristic == "manhattan"
-            else self.misplaced_tiles
+        memory_limit = (
+            memory_limit_mb * 1024 * 1024 if memory_limit_mb is not None else None
         )
 
-        p = weight if algorithm == "wastar" else 1.0
-        heapq.heappush(open_set, (h_func(start_state) * p, 0, start_state))
+        # Les états circulent sous forme d'entiers ; conversion uniquement aux bords
+        start, start_blank = self._pack(start_state)
+        goal, goal_blank = self._pack(self.goal_state)
+
+        # Heuristique additive par tuile (table) ou modèle incrémental (step)
+        table = self._board.tables.get(heuristic)
+        if table is not None:
+            model = None
+            h_start, aux_start = self._packed_heuristic(table, start), 0
+        else:
+            try:
+                model = self._heuristic_model(heuristic)
+            except OSError:
+                return {
+                    "success": False,
+                    "message": f"Base de motifs introuvable : {self.pdb_path}",
+                }
+            except ValueError as exc:
+                return {"success": False, "message": str(exc)}
+            h_start, aux_start = model.initial(start)
+
+        if algorithm == "idastar":
+            return self._solve_idastar(
+                start,
+                start_blank,
+                goal,
+                table,
+                model,
+                h_start,
+                aux_start,
+                progress,
+                progress_every,
+            )
+        if algorithm == "parallel_idastar":
+            return self._solve_parallel_idastar(
+                start,
+                start_blank,
+                goal,
+                heuristic,
+                table,
+                model,
+                h_start,
+                aux_start,
+                workers,
+                progress,
+            )
+        if algorithm == "anytime":
+            return self._solve_anytime(
+                start,
+                start_blank,
+                goal,
+                table,
+                model,
+                h_start,
+                aux_start,
+                weight,
+                on_solution,
+                time_limit,
+                memory_limit,
+                progress,
+                progress_every,
+            )
+        if algorithm == "bidirectional":
+            return self._solve_bidirectional(
+                start,
+                start_blank,
+                goal,
+                goal_blank,
+                heuristic,
+                table,
+                model,
+                h_start,
+                aux_start,
+                memory_limit,
+                progress,
+                progress_every,
+            )
+
+        # h voyage avec chaque nœud : (f, g, h, état, vide, aux). f entier en
+        # A* simple : file à seaux ; A* pondéré (f réel) : tas binaire.
+        p = weight if algorithm == "wastar" else 1
+        open_set: Union[_BucketQueue, _HeapQueue] = (
+            _BucketQueue() if isinstance(p, int) else _HeapQueue()
+        )
+        open_set.push((h_start * p, 0, h_start, start, start_blank, aux_start))
 
-        came_from: Dict[State, Optional[State]] = {start_state: None}
-        g_score: Dict[State, int] = {start_state: 0}
+        # Ensemble fermé compact : g et coup d'arrivée par état, sans parent
+        board = self._board
+        closed = _StateTable(board.cells * board.bits)
+        closed.put(closed.slot(start), start, 0, _NO_MOVE)
 
+        moves, shifts, mask = board.moves, board.shifts, board.mask
         nodes_explored = 0
         start_time = time.time()
 
@@ -98,45 +1095,1255 @@ class TaquinSolver:
                     "message": "Calcul interrompu par l'utilisateur.",
                 }
 
-            _, g, current = heapq.heappop(open_set)
+            f, g, h, current, blank, aux = open_set.pop()
+            # Entrée périmée : l'état a été réinséré depuis avec un meilleur g
+            if closed.g[closed.slot(current)] != g:
+                continue
             nodes_explored += 1
 
-            if current == self.goal_state:
-                path = []
-                while current:
-                    path.append(current)
-                    current = came_from[current]
+            if current == goal:
                 return {
                     "success": True,
-                    "path": path[::-1],
+                    "path": self._replay_path(closed, current, blank),
                     "nodes": nodes_explored,
                     "time": (time.time() - start_time) * 1000,
                 }
 
-            # Génération des voisins
-            r, c = -1, -1
-            for i in range(4):
-                for j in range(4):
-                    if current[i][j] == 0:
-                        r, c = i, j
+            # Plafond mémoire : échec propre plutôt que de faire swapper l'hôte
+            if (
+                memory_limit is not None
+                and nodes_explored & 4095 == 0
+                and closed.nbytes + len(open_set) * _OPEN_ENTRY_BYTES > memory_limit
+            ):
+                return {"success": False, "message": _memory_message(memory_limit)}
+            if progress is not None and nodes_explored % progress_every == 0:
+                self._report(
+                    progress,
+                    nodes_explored,
+                    start_time,
+                    len(open_set),
+                    closed.size,
+                    f,
+                    closed.nbytes + len(open_set) * _OPEN_ENTRY_BYTES,
+                )
 
-            for dr, dc in [(-1, 0), (1, 0), (0, -1), (0, 1)]:
-                nr, nc = r + dr, c + dc
-                if 0 <= nr < 4 and 0 <= nc < 4:
-                    # Création rapide de l'état voisin
-                    temp = [list(row) for row in current]
-                    temp[r][c], temp[nr][nc] = temp[nr][nc], temp[r][c]
-                    neighbor = tuple(tuple(row) for row in temp)
+            # Génération des voisins : la tuile glisse dans le vide (décalages)
+            blank_shift = shifts[blank]
+            for nb, move in moves[blank]:
+                shift = shifts[nb]
+                tile = (current >> shift) & mask
+                neighbor = current + (tile << blank_shift) - (tile << shift)
 
-                    tentative_g = g + 1
-                    if neighbor not in g_score or tentative_g < g_score[neighbor]:
-                        g_score[neighbor] = tentative_g
-                        f = tentative_g + (h_func(neighbor) * p)
-                        came_from[neighbor] = current
-                        heapq.heappush(open_set, (f, tentative_g, neighbor))
+                tentative_g = g + 1
+                slot = closed.slot(neighbor)
+                if closed.keys[slot] == 0 or tentative_g < closed.g[slot]:
+                    closed.put(slot, neighbor, tentative_g, move)
+                    # Mise à jour incrémentale : seule la tuile déplacée change
+                    if table is not None:
+                        tile_costs = table[tile]
+                        h_nb = h - tile_costs[nb] + tile_costs[blank]
+                        aux_nb = 0
+                    else:
+                        h_nb, aux_nb = model.step(h, aux, current, tile, nb, blank)
+                    f_nb = tentative_g + h_nb * p
+                    open_set.push((f_nb, tentative_g, h_nb, neighbor, nb, aux_nb))
 
         return {"success": False, "message": "Aucune solution."}
 
+    def _report(
+        self,
+        progress: Callable[[Dict[str, Any]], None],
+        nodes: int,
+        start_time: float,
+        open_size: int,
+        closed_size: int,
+        best_f: float,
+        memory_bytes: int,
+    ) -> None:
+        elapsed = time.time() - start_time
+        progress(
+            {
+                "nodes": nodes,
+                "nodes_per_sec": nodes / elapsed if elapsed > 0 else 0.0,
+                "open": open_size,
+                "closed": closed_size,
+                "best_f": best_f,
+                "memory_mb": memory_bytes / (1024 * 1024),
+                "elapsed_ms": elapsed * 1000,
+            }
+        )
+
+    def _replay_path(self, closed: _StateTable, node: int, blank: int) -> List[State]:
+        # Reconstruction en rejouant à l'envers le coup mémorisé pour chaque état
+        board = self._board
+        shifts, mask = board.shifts, board.mask
+        path = [self._unpack(node)]
+        move = closed.moves[closed.slot(node)]
+        while move != _NO_MOVE:
+            prev_blank = blank - board.offsets[move]
+            tile = (node >> shifts[prev_blank]) & mask
+            node = node + (tile << shifts[blank]) - (tile << shifts[prev_blank])
+            blank = prev_blank
+            path.append(self._unpack(node))
+            move = closed.moves[closed.slot(node)]
+        return path[::-1]
+
+    def _solve_anytime(
+        self,
+        start: int,
+        start_blank: int,
+        goal: int,
+        table: Optional[Tuple[Tuple[int, ...], ...]],
+        model: Any,
+        h_start: int,
+        aux_start: int,
+        weight: float,
+        on_solution: Optional[Callable[[Dict[str, Any]], None]],
+        time_limit: Optional[float],
+        memory_limit: Optional[float],
+        progress: Optional[Callable[[Dict[str, Any]], None]],
+        progress_every: int,
+    ) -> Dict[str, Any]:
+        # ARA* (Likhachev et al.) : A* pondéré répété avec un poids
+        # décroissant. Les états améliorés après leur développement vont dans
+        # INCONS et sont réinjectés dans la file à l'itération suivante, au
+        # lieu de tout recommencer.
+        board = self._board
+        moves, shifts, mask = board.moves, board.shifts, board.mask
+        known = _StateTable(board.cells * board.bits)
+        known.put(known.slot(start), start, 0, _NO_MOVE)
+        # Candidats : état -> (g, h, vide, aux) ; la file est reconstruite à
+        # chaque changement de poids à partir de OPEN ∪ INCONS
+        pending: Dict[int, Tuple[int, int, int, int]] = {
+            start: (0, h_start, start_blank, aux_start)
+        }
+        w = max(weight, 1.0)
+        best: Optional[Dict[str, Any]] = None
+        goal_g = 1 << 30
+        goal_blank = -1
+        nodes_explored = 0
+        start_time = time.time()
+        deadline = start_time + time_limit if time_limit is not None else None
+
+        while True:
+            open_set: List[Tuple[float, int, int, int, int, int]] = [
+                (g + w * h, g, h, state, blank, aux)
+                for state, (g, h, blank, aux) in pending.items()
+            ]
+            heapq.heapify(open_set)
+            expanded: Set[int] = set()
+            incons: Dict[int, Tuple[int, int, int, int]] = {}
+
+            while open_set and open_set[0][0] < goal_g:
+                if self._abort or (deadline is not None and time.time() > deadline):
+                    return self._anytime_result(best, nodes_explored, start_time)
+
+                _, g, h, current, blank, aux = heapq.heappop(open_set)
+                if known.g[known.slot(current)] != g or current in expanded:
+                    continue
+                expanded.add(current)
+                nodes_explored += 1
+                # Plafond mémoire : on rend la meilleure solution déjà trouvée
+                if (
+                    memory_limit is not None
+                    and nodes_explored & 4095 == 0
+                    and known.nbytes
+                    + len(open_set) * _OPEN_ENTRY_BYTES
+                    + (len(expanded) + len(incons) + len(pending)) * _DICT_ENTRY_BYTES
+                    > memory_limit
+                ):
+                    return self._anytime_result(
+                        best, nodes_explored, start_time, _memory_message(memory_limit)
+                    )
+                if progress is not None and nodes_explored % progress_every == 0:
+                    self._report(
+                        progress,
+                        nodes_explored,
+                        start_time,
+                        len(open_set),
+                        known.size,
+                        open_set[0][0] if open_set else g + w * h,
+                        known.nbytes + len(open_set) * _OPEN_ENTRY_BYTES,
+                    )
+                if current == goal:
+                    goal_g, goal_blank = g, blank
+                    continue
+
+                blank_shift = shifts[blank]
+                for nb, move in moves[blank]:
+                    shift = shifts[nb]
+                    tile = (current >> shift) & mask
+                    neighbor = current + (tile << blank_shift) - (tile << shift)
+
+                    tentative_g = g + 1
+                    slot = known.slot(neighbor)
+                    if known.keys[slot] != 0 and tentative_g >= known.g[slot]:
+                        continue
+                    known.put(slot, neighbor, tentative_g, move)
+                    if table is not None:
+                        tile_costs = table[tile]
+                        h_nb = h - tile_costs[nb] + tile_costs[blank]
+                        aux_nb = 0
+                    else:
+                        h_nb, aux_nb = model.step(h, aux, current, tile, nb, blank)
+                    if neighbor == goal and tentative_g < goal_g:
+                        goal_g, goal_blank = tentative_g, nb
+                    if neighbor in expanded:
+                        incons[neighbor] = (tentative_g, h_nb, nb, aux_nb)
+                    else:
+                        f_nb = tentative_g + w * h_nb
+                        heapq.heappush(
+                            open_set, (f_nb, tentative_g, h_nb, neighbor, nb, aux_nb)
+                        )
+
+            # OPEN ∪ INCONS pour la suite (entrées à jour, non développées)
+            pending = incons
+            for _, g, h, state, blank, aux in open_set:
+                if state not in expanded and known.g[known.slot(state)] == g:
+                    pending[state] = (g, h, blank, aux)
+
+            if goal_g < 1 << 30:
+                # Borne de sous-optimalité : coût / min(g + h) des candidats
+                lower = min((g + h for g, h, _, _ in pending.values()), default=goal_g)
+                bound = min(w, goal_g / lower) if lower > 0 else 1.0
+                if best is None or goal_g < best["cost"] or bound < best["bound"]:
+                    best = {
+                        "path": self._replay_path(known, goal, goal_blank),
+                        "cost": goal_g,
+                        "weight": w,
+                        "bound": max(bound, 1.0),
+                    }
+                    if on_solution is not None:
+                        on_solution(dict(best, nodes=nodes_explored))
+                if best["bound"] <= 1.0:
+                    return self._anytime_result(best, nodes_explored, start_time)
+            elif w <= 1.0:
+                return {"success": False, "message": "Aucune solution."}
+
+            w = max(1.0, w - _ARA_WEIGHT_STEP)
+
+    def _anytime_result(
+        self,
+        best: Optional[Dict[str, Any]],
+        nodes: int,
+        start_time: float,
+        message: Optional[str] = None,
+    ) -> Dict[str, Any]:
+        # Meilleure solution connue à l'arrêt (optimale, délai, mémoire ou
+        # interruption) ; message explique l'échec s'il n'y en a aucune
+        if best is None:
+            if message is None:
+                message = (
+                    "Calcul interrompu par l'utilisateur."
+                    if self._abort
+                    else "Délai dépassé."
+                )
+            return {"success": False, "message": message}
+        return {
+            "success": True,
+            "path": best["path"],
+            "nodes": nodes,
+            "time": (time.time() - start_time) * 1000,
+            "bound": best["bound"],
+            "optimal": best["bound"] <= 1.0,
+        }
+
+    def _solve_bidirectional(
+        self,
+        start: int,
+        start_blank: int,
+        goal: int,
+        goal_blank: int,
+        heuristic: str,
+        table: Optional[Tuple[Tuple[int, ...], ...]],
+        model: Any,
+        h_start: int,
+        aux_start: int,
+        memory_limit: Optional[float],
+        progress: Optional[Callable[[Dict[str, Any]], None]],
+        progress_every: int,
+    ) -> Dict[str, Any]:
+        # Deux recherches de front, départ -> but et but -> départ : les coups
+        # sont réversibles, la recherche arrière part donc du but avec les
+        # mêmes voisins et la même heuristique, dirigée vers le départ. Chaque
+        # nœud porte les deux heuristiques : hp vers le but de son côté, ho vers
+        # l'autre extrémité. On développe le côté dont la file a la plus petite
+        # clé b = 2g + hp - ho (BAE* / DIBBS, Sewell et Jacobson), ce qui rend
+        # la borne (bmin avant + bmin arrière) / 2 serrée. Arrêt dès que le
+        # meilleur raccord U ne dépasse pas la plus grande des bornes : cette
+        # borne BAE* et celles de MM (Holte et al.), soit la plus petite
+        # priorité max(f, 2g), les plus petits f de chaque côté et la somme des
+        # plus petits g plus un coup. Toutes sont valides quel que soit l'ordre
+        # de développement (heuristiques cohérentes) : U est alors optimal.
+        try:
+            back_table, back_model = self._heuristic_towards(heuristic, start)
+        except ValueError as exc:
+            return {"success": False, "message": str(exc)}
+
+        def evaluate(
+            side_table: Optional[Tuple[Tuple[int, ...], ...]],
+            side_model: Any,
+            state: int,
+        ) -> Tuple[int, int]:
+            if side_table is not None:
+                return self._packed_heuristic(side_table, state), 0
+            return side_model.initial(state)
+
+        board = self._board
+        moves, shifts, mask = board.moves, board.shifts, board.mask
+        # Par côté : file, ensemble fermé compact, heuristiques (table ou
+        # modèle) vers son but puis vers l'autre extrémité, histogrammes des
+        # f, des g et des priorités MM des entrées de la file
+        sides: List[Tuple[Any, ...]] = []
+        h_back, aux_back = evaluate(back_table, back_model, start)
+        h_goal, aux_goal = evaluate(back_table, back_model, goal)
+        h_fwd, aux_fwd = evaluate(table, model, goal)
+        for root, blank, h, aux, h_other, aux_other, own, other_end in (
+            (
+                start,
+                start_blank,
+                h_start,
+                aux_start,
+                h_back,
+                aux_back,
+                (table, model),
+                (back_table, back_model),
+            ),
+            (
+                goal,
+                goal_blank,
+                h_goal,
+                aux_goal,
+                h_fwd,
+                aux_fwd,
+                (back_table, back_model),
+                (table, model),
+            ),
+        ):
+            open_set = _BucketQueue()
+            open_set.push((h - h_other, 0, h, root, blank, aux, h_other, aux_other))
+            closed = _StateTable(board.cells * board.bits)
+            closed.put(closed.slot(root), root, 0, _NO_MOVE)
+            f_counts, g_counts, mm_counts = (
+                [0] * (h + 1),
+                [0] * (h + 1),
+                [0] * (h + 1),
+            )
+            f_counts[h] += 1
+            g_counts[0] += 1
+            mm_counts[h] += 1
+            sides.append(
+                (open_set, closed) + own + other_end + (f_counts, g_counts, mm_counts)
+            )
+
+        best_cost = 0 if start == goal else _NO_BOUND
+        meeting, meeting_blank = start, start_blank
+        nodes_explored = 0
+        start_time = time.time()
+        checked: Optional[Tuple[int, int, int]] = None
+
+        while sides[0][0] and sides[1][0]:
+            if self._abort:
+                return {
+                    "success": False,
+                    "message": "Calcul interrompu par l'utilisateur.",
+                }
+
+            # Les bornes ne bougent guère qu'avec les clés minimales ou U : on
+            # ne les réévalue qu'alors (un arrêt différé reste exact). Les
+            # entrées périmées restent comptées jusqu'à leur sortie : elles ne
+            # peuvent qu'abaisser les bornes, l'arrêt reste donc prouvé.
+            b_fwd, b_bwd = sides[0][0].min_key(), sides[1][0].min_key()
+            if best_cost < _NO_BOUND and (b_fwd, b_bwd, best_cost) != checked:
+                checked = (b_fwd, b_bwd, best_cost)
+                if best_cost <= max(
+                    (b_fwd + b_bwd + 1) // 2,
+                    min(_lowest(sides[0][8]), _lowest(sides[1][8])),
+                    _lowest(sides[0][6]),
+                    _lowest(sides[1][6]),
+                    _lowest(sides[0][7]) + _lowest(sides[1][7]) + 1,
+                ):
+                    break
+            if b_fwd != b_bwd:
+                side = 0 if b_fwd < b_bwd else 1
+            else:
+                side = 0 if len(sides[0][0]) <= len(sides[1][0]) else 1
+            (
+                open_set,
+                closed,
+                side_table,
+                side_model,
+                other_table,
+                other_model,
+                f_counts,
+                g_counts,
+                mm_counts,
+            ) = sides[side]
+            other = sides[1 - side][1]
+
+            key, g, h, current, blank, aux, h_other, aux_other = open_set.pop()
+            f_counts[g + h] -= 1
+            g_counts[g] -= 1
+            mm_counts[max(g + h, 2 * g)] -= 1
+            # Entrée périmée : l'état a été réinséré depuis avec un meilleur g
+            if closed.g[closed.slot(current)] != g:
+                continue
+            nodes_explored += 1
+            if memory_limit is not None and nodes_explored & 4095 == 0:
+                used = (
+                    sides[0][1].nbytes
+                    + sides[1][1].nbytes
+                    + (len(sides[0][0]) + len(sides[1][0])) * _OPEN_ENTRY_BYTES
+                )
+                if used > memory_limit:
+                    return {"success": False, "message": _memory_message(memory_limit)}
+            if progress is not None and nodes_explored % progress_every == 0:
+                open_size = len(sides[0][0]) + len(sides[1][0])
+                self._report(
+                    progress,
+                    nodes_explored,
+                    start_time,
+                    open_size,
+                    sides[0][1].size + sides[1][1].size,
+                    key,
+                    sides[0][1].nbytes
+                    + sides[1][1].nbytes
+                    + open_size * _OPEN_ENTRY_BYTES,
+                )
+
+            blank_shift = shifts[blank]
+            for nb, move in moves[blank]:
+                shift = shifts[nb]
+                tile = (current >> shift) & mask
+                neighbor = current + (tile << blank_shift) - (tile << shift)
+
+                tentative_g = g + 1
+                slot = closed.slot(neighbor)
+                if closed.keys[slot] != 0 and closed.g[slot] <= tentative_g:
+                    continue
+                closed.put(slot, neighbor, tentative_g, move)
+                if side_table is not None:
+                    tile_costs = side_table[tile]
+                    h_nb = h - tile_costs[nb] + tile_costs[blank]
+                    aux_nb = 0
+                else:
+                    h_nb, aux_nb = side_model.step(h, aux, current, tile, nb, blank)
+                if other_table is not None:
+                    tile_costs = other_table[tile]
+                    h_other_nb = h_other - tile_costs[nb] + tile_costs[blank]
+                    aux_other_nb = 0
+                else:
+                    h_other_nb, aux_other_nb = other_model.step(
+                        h_other, aux_other, current, tile, nb, blank
+                    )
+                open_set.push(
+                    (
+                        2 * tentative_g + h_nb - h_other_nb,
+                        tentative_g,
+                        h_nb,
+                        neighbor,
+                        nb,
+                        aux_nb,
+                        h_other_nb,
+                        aux_other_nb,
+                    )
+                )
+                # max(f, 2g) majore f et g : une seule extension suffit
+                f_nb = tentative_g + h_nb
+                mm_nb = max(f_nb, 2 * tentative_g)
+                if mm_nb >= len(mm_counts):
+                    grow = [0] * (mm_nb + 1 - len(mm_counts))
+                    f_counts.extend(grow)
+                    g_counts.extend(grow)
+                    mm_counts.extend(grow)
+                f_counts[f_nb] += 1
+                g_counts[tentative_g] += 1
+                mm_counts[mm_nb] += 1
+
+                # Raccord avec l'autre côté (ouvert ou fermé)
+                other_slot = other.slot(neighbor)
+                if other.keys[other_slot] != 0:
+                    cost = tentative_g + other.g[other_slot]
+                    if cost < best_cost:
+                        best_cost, meeting, meeting_blank = cost, neighbor, nb
+
+        if best_cost == _NO_BOUND:
+            return {"success": False, "message": "Aucune solution."}
+
+        # Départ -> raccord, puis raccord -> but en sens inverse
+        forward = self._replay_path(sides[0][1], meeting, meeting_blank)
+        backward = self._replay_path(sides[1][1], meeting, meeting_blank)
+        return {
+            "success": True,
+            "path": forward + backward[-2::-1],
+            "nodes": nodes_explored,
+            "time": (time.time() - start_time) * 1000,
+        }
+
+    def _heuristic_towards(
+        self, heuristic: str, target: int
+    ) -> Tuple[Optional[Tuple[Tuple[int, ...], ...]], Any]:
+        # Même heuristique, mais vers un état cible quelconque (le départ,
+        # pour la recherche arrière) : (table additive, None) ou (None,
+        # modèle). Les bases de motifs ne valent que pour le but.
+        board = self._board
+        targets = [0] * board.cells
+        for k, shift in enumerate(board.shifts):
+            targets[(target >> shift) & board.mask] = k
+        if heuristic in _TILE_COSTS:
+            return _tile_table(heuristic, board.cols, targets), None
+        if heuristic in _MODEL_FACTORIES:
+            return None, self._heuristic_model(heuristic).towards(targets)
+        raise ValueError(
+            f"Heuristique {heuristic!r} propre au but : "
+            "la recherche bidirectionnelle ne peut pas l'utiliser."
+        )
+
+    def _solve_idastar(
+        self,
+        start: int,
+        start_blank: int,
+        goal: int,
+        table: Optional[Tuple[Tuple[int, ...], ...]],
+        model: Any,
+        h_start: int,
+        aux_start: int,
+        progress: Optional[Callable[[Dict[str, Any]], None]],
+        progress_every: int,
+    ) -> Dict[str, Any]:
+        # IDA* : profondeur d'abord bornée par f, sans ensemble fermé.
+        # La mémoire se limite au chemin courant.
+        nodes_explored = 0
+        start_time = time.time()
+        bound = h_start
+        while True:
+            t, path, nodes = self._bounded_dfs(
+                start,
+                start_blank,
+                -1,
+                0,
+                h_start,
+                aux_start,
+                bound,
+                goal,
+                table,
+                model,
+                progress,
+                progress_every,
+                nodes_explored,
+                start_time,
+            )
+            nodes_explored += nodes
+            if t == _FOUND:
+                return {
+                    "success": True,
+                    "path": [self._unpack(node) for node in path],
+                    "nodes": nodes_explored,
+                    "time": (time.time() - start_time) * 1000,
+                }
+            if t == _ABORTED:
+                return {
+                    "success": False,
+                    "message": "Calcul interrompu par l'utilisateur.",
+                }
+            if t >= _NO_BOUND:
+                return {"success": False, "message": "Aucune solution."}
+            bound = t
+
+    def _bounded_dfs(
+        self,
+        root: int,
+        root_blank: int,
+        root_prev: int,
+        root_g: int,
+        root_h: int,
+        root_aux: int,
+        bound: int,
+        goal: int,
+        table: Optional[Tuple[Tuple[int, ...], ...]],
+        model: Any,
+        progress: Optional[Callable[[Dict[str, Any]], None]] = None,
+        progress_every: int = 10000,
+        nodes_before: int = 0,
+        start_time: float = 0.0,
+    ) -> Tuple[int, List[int], int]:
+        # Une itération d'IDA* sous `bound` depuis `root` (profondeur root_g).
+        # Renvoie (_FOUND, chemin depuis root, nœuds), (_ABORTED, [], nœuds)
+        # ou (plus petit f dépassant la borne, [], nœuds).
+        board = self._board
+        neighbors, shifts, mask = board.neighbors, board.shifts, board.mask
+        nodes_explored = 0
+        path: List[int] = [root]
+
+        def dfs(
+            current: int, blank: int, prev: int, g: int, h: int, aux: int
+        ) -> int:
+            nonlocal nodes_explored
+            f = g + h
+            if f > bound:
+                return f
+            if self._abort:
+                return _ABORTED
+            nodes_explored += 1
+            if current == goal:
+                return _FOUND
+            if progress is not None and nodes_explored % progress_every == 0:
+                # Pas de file : la « frontière » est le chemin courant
+                self._report(
+                    progress,
+                    nodes_before + nodes_explored,
+                    start_time,
+                    len(path),
+                    0,
+                    bound,
+                    len(path) * _OPEN_ENTRY_BYTES,
+                )
+
+            next_bound = _NO_BOUND
+            blank_shift = shifts[blank]
+            for nb in neighbors[blank]:
+                # Élagage du coup inverse : on ne remet pas le vide d'où il vient
+                if nb == prev:
+                    continue
+                shift = shifts[nb]
+                tile = (current >> shift) & mask
+                neighbor = current + (tile << blank_shift) - (tile << shift)
+                if table is not None:
+                    tile_costs = table[tile]
+                    h_nb = h - tile_costs[nb] + tile_costs[blank]
+                    aux_nb = 0
+                else:
+                    h_nb, aux_nb = model.step(h, aux, current, tile, nb, blank)
+
+                path.append(neighbor)
+                t = dfs(neighbor, nb, blank, g + 1, h_nb, aux_nb)
+                if t < 0:
+                    return t
+                path.pop()
+                if t < next_bound:
+                    next_bound = t
+            return next_bound
+
+        t = dfs(root, root_blank, root_prev, root_g, root_h, root_aux)
+        return t, path if t == _FOUND else [], nodes_explored
+
+    def _solve_parallel_idastar(
+        self,
+        start: int,
+        start_blank: int,
+        goal: int,
+        heuristic: str,
+        table: Optional[Tuple[Tuple[int, ...], ...]],
+        model: Any,
+        h_start: int,
+        aux_start: int,
+        workers: Optional[int],
+        progress: Optional[Callable[[Dict[str, Any]], None]],
+    ) -> Dict[str, Any]:
+        # IDA* multi-cœurs : un parcours en largeur (avec dédoublonnage)
+        # produit une frontière de quelques milliers de nœuds à profondeur
+        # fixe, puis chaque seuil est réparti en lots sur un pool de
+        # processus. Le seuil est commun à tous ; la première solution
+        # trouvée est optimale et annule les autres lots.
+        board = self._board
+        neighbors, shifts, mask = board.neighbors, board.shifts, board.mask
+        start_time = time.time()
+        nodes_explored = 0
+
+        parents: Dict[int, int] = {start: -1}
+        layer: Dict[int, Tuple[int, int, int, int]] = {
+            start: (start_blank, -1, h_start, aux_start)
+        }
+        depth = 0
+        while len(layer) < _PARALLEL_FRONTIER:
+            if self._abort:
+                return {
+                    "success": False,
+                    "message": "Calcul interrompu par l'utilisateur.",
+                }
+            if goal in layer:
+                break
+            next_layer: Dict[int, Tuple[int, int, int, int]] = {}
+            for current, (blank, prev, h, aux) in layer.items():
+                nodes_explored += 1
+                blank_shift = shifts[blank]
+                for nb in neighbors[blank]:
+                    if nb == prev:
+                        continue
+                    shift = shifts[nb]
+                    tile = (current >> shift) & mask
+                    neighbor = current + (tile << blank_shift) - (tile << shift)
+                    if neighbor in parents:
+                        continue
+                    parents[neighbor] = current
+                    if table is not None:
+                        tile_costs = table[tile]
+                        h_nb = h - tile_costs[nb] + tile_costs[blank]
+                        aux_nb = 0
+                    else:
+                        h_nb, aux_nb = model.step(h, aux, current, tile, nb, blank)
+                    next_layer[neighbor] = (nb, blank, h_nb, aux_nb)
+            if not next_layer:
+                break
+            layer = next_layer
+            depth += 1
+
+        def prefix(node: int) -> List[int]:
+            chain: List[int] = []
+            while node != -1:
+                chain.append(node)
+                node = parents[node]
+            chain.reverse()
+            return chain
+
+        if goal in parents:
+            return {
+                "success": True,
+                "path": [self._unpack(node) for node in prefix(goal)],
+                "nodes": nodes_explored,
+                "time": (time.time() - start_time) * 1000,
+            }
+
+        # Lots entrelacés par h croissant : chaque lot mêle nœuds prometteurs
+        # et nœuds coûteux, la durée d'un seuil reste homogène entre lots.
+        frontier = sorted(layer.items(), key=lambda item: item[1][2])
+        workers = workers or os.cpu_count() or 1
+        chunk_count = min(len(frontier), workers * _PARALLEL_CHUNKS)
+        chunks = [
+            [(state,) + info for state, info in frontier[i::chunk_count]]
+            for i in range(chunk_count)
+        ]
+        bound = min(depth + info[2] for _, info in frontier)
+
+        cancel = multiprocessing.Event()
+        with ProcessPoolExecutor(
+            max_workers=workers,
+            initializer=_init_parallel_worker,
+            initargs=(self.pdb_path, self.rows, self.cols, cancel),
+        ) as pool:
+            while True:
+                pending = {
+                    pool.submit(_parallel_dfs_task, chunk, bound, depth, heuristic)
+                    for chunk in chunks
+                }
+                next_bound = _NO_BOUND
+                found: Optional[List[int]] = None
+                while pending and found is None:
+                    if self._abort:
+                        cancel.set()
+                        for future in pending:
+                            future.cancel()
+                        return {
+                            "success": False,
+                            "message": "Calcul interrompu par l'utilisateur.",
+                        }
+                    done, pending = wait(
+                        pending, timeout=0.2, return_when=FIRST_COMPLETED
+                    )
+                    for future in done:
+                        t, path, nodes = future.result()
+                        nodes_explored += nodes
+                        if t == _FOUND:
+                            found = path
+                            break
+                        if 0 <= t < next_bound:
+                            next_bound = t
+
+                if found is not None:
+                    cancel.set()
+                    for future in pending:
+                        future.cancel()
+                    full_path = prefix(found[0]) + found[1:]
+                    return {
+                        "success": True,
+                        "path": [self._unpack(node) for node in full_path],
+                        "nodes": nodes_explored,
+                        "time": (time.time() - start_time) * 1000,
+                    }
+                if next_bound >= _NO_BOUND:
+                    return {"success": False, "message": "Aucune solution."}
+                if progress is not None:
+                    self._report(
+                        progress,
+                        nodes_explored,
+                        start_time,
+                        len(frontier),
+                        0,
+                        next_bound,
+                        len(parents) * _DICT_ENTRY_BYTES,
+                    )
+                bound = next_bound
+
+
+# --- Résolution par lots (hors interface) ---
+
+_worker_solver: Optional[TaquinSolver] = None  # Un solveur par processus
+
+
+def _init_worker(pdb_path: Optional[str], rows: int, cols: int) -> None:
+    global _worker_solver
+    _worker_solver = TaquinSolver(pdb_path, rows, cols)
+
+
+def _init_parallel_worker(
+    pdb_path: Optional[str], rows: int, cols: int, cancel: Any
+) -> None:
+    # L'événement partagé relaie l'annulation vers le drapeau d'arrêt local
+    _init_worker(pdb_path, rows, cols)
+    solver = _worker_solver
+    assert solver is not None
+
+    def watch() -> None:
+        cancel.wait()
+        solver.request_stop()
+
+    threading.Thread(target=watch, daemon=True).start()
+
+
+def _parallel_dfs_task(
+    chunk: List[Tuple[int, int, int, int, int]],
+    bound: int,
+    depth: int,
+    heuristic: str,
+) -> Tuple[int, List[int], int]:
+    # Un seuil d'IDA* sur un lot de nœuds de frontière (profondeur `depth`)
+    solver = _worker_solver
+    assert solver is not None
+    goal = solver._pack(solver.goal_state)[0]
+    table = solver._board.tables.get(heuristic)
+    model = None if table is not None else solver._heuristic_model(heuristic)
+    nodes_explored = 0
+    next_bound = _NO_BOUND
+    for state, blank, prev, h, aux in chunk:
+        t, path, nodes = solver._bounded_dfs(
+            state, blank, prev, depth, h, aux, bound, goal, table, model
+        )
+        nodes_explored += nodes
+        if t < 0:
+            return t, path, nodes_explored
+        if t < next_bound:
+            next_bound = t
+    return next_bound, [], nodes_explored
+
+
+def _solve_instance(
+    index: int,
+    state: State,
+    heuristic: str,
+    algorithm: str,
+    weight: float,
+    timeout: Optional[float],
+    memory_limit_mb: Optional[float],
+    as_moves: bool = False,
+) -> Dict[str, Any]:
+    solver = _worker_solver or TaquinSolver()
+    # Le délai réutilise le drapeau d'arrêt : la recherche s'interrompt proprement
+    timer = threading.Timer(timeout, solver.request_stop) if timeout else None
+    if timer is not None:
+        timer.start()
+    try:
+        result = solver.solve(
+            state,
+            heuristic=heuristic,
+            algorithm=algorithm,
+            weight=weight,
+            memory_limit_mb=memory_limit_mb,
+            as_moves=as_moves,
+        )
+    finally:
+        if timer is not None:
+            timer.cancel()
+    if solver._abort and not result["success"]:
+        result["message"] = "Délai dépassé."
+    return {"index": index, **result}
+
+
+def solve_many(
+    states: Iterable[State],
+    heuristic: str = "manhattan",
+    algorithm: str = "astar",
+    weight: float = 1.5,
+    workers: Optional[int] = None,
+    timeout: Optional[float] = None,
+    pdb_path: Optional[str] = None,
+    rows: int = 4,
+    cols: int = 4,
+    memory_limit_mb: Optional[float] = None,
+    as_moves: bool = False,
+) -> Iterator[Dict[str, Any]]:
+    # Répartit les instances sur un pool de processus (un cœur chacun, sans
+    # GIL partagé) et rend chaque résultat dès qu'il est prêt, avec son
+    # "index" dans l'entrée. as_moves : solutions en chaîne U/D/L/R.
+    with ProcessPoolExecutor(
+        max_workers=workers,
+        initializer=_init_worker,
+        initargs=(pdb_path, rows, cols),
+    ) as pool:
+        futures = [
+            pool.submit(
+                _solve_instance,
+                index,
+                state,
+                heuristic,
+                algorithm,
+                weight,
+                timeout,
+                memory_limit_mb,
+                as_moves,
+            )
+            for index, state in enumerate(states)
+        ]
+        for future in as_completed(futures):
+            yield future.result()
+
+
+def parse_instances(
+    lines: Iterable[str], rows: int = 4, cols: int = 4
+) -> List[State]:
+    # Une instance par ligne : rows × cols entiers (lecture ligne par ligne),
+    # séparés par des espaces ou des virgules ; lignes vides et "#" ignorées.
+    states = []
+    for line in lines:
+        line = line.split("#", 1)[0].replace(",", " ").strip()
+        if not line:
+            continue
+        values = [int(v) for v in line.split()]
+        if sorted(values) != list(range(rows * cols)):
+            raise ValueError(f"Instance invalide : {line!r}")
+        states.append(
+            tuple(tuple(values[i * cols : i * cols + cols]) for i in range(rows))
+        )
+    return states
+
+
+# --- Banc d'essai (mesures reproductibles) ---
+
+# Les 100 instances de Korf (1985), dans son orientation (vide en case 0, but
+# 0 1 2 ... 15), suivies de leur longueur optimale.
+_KORF_100 = """
+14 13 15 7 11 12 9 5 6 0 2 1 4 8 10 3 57
+13 5 4 10 9 12 8 14 2 3 7 1 0 15 11 6 55
+14 7 8 2 13 11 10 4 9 12 5 0 3 6 1 15 59
+5 12 10 7 15 11 14 0 8 2 1 13 3 4 9 6 56
+4 7 14 13 10 3 9 12 11 5 6 15 1 2 8 0 56
+14 7 1 9 12 3 6 15 8 11 2 5 10 0 4 13 52
+2 11 15 5 13 4 6 7 12 8 10 1 9 3 14 0 52
+12 11 15 3 8 0 4 2 6 13 9 5 14 1 10 7 50
+3 14 9 11 5 4 8 2 13 12 6 7 10 1 15 0 46
+13 11 8 9 0 15 7 10 4 3 6 14 5 12 2 1 59
+5 9 13 14 6 3 7 12 10 8 4 0 15 2 11 1 57
+14 1 9 6 4 8 12 5 7 2 3 0 10 11 13 15 45
+3 6 5 2 10 0 15 14 1 4 13 12 9 8 11 7 46
+7 6 8 1 11 5 14 10 3 4 9 13 15 2 0 12 59
+13 11 4 12 1 8 9 15 6 5 14 2 7 3 10 0 62
+1 3 2 5 10 9 15 6 8 14 13 11 12 4 7 0 42
+15 14 0 4 11 1 6 13 7 5 8 9 3 2 10 12 66
+6 0 14 12 1 15 9 10 11 4 7 2 8 3 5 13 55
+7 11 8 3 14 0 6 15 1 4 13 9 5 12 2 10 46
+6 12 11 3 13 7 9 15 2 14 8 10 4 1 5 0 52
+12 8 14 6 11 4 7 0 5 1 10 15 3 13 9 2 54
+14 3 9 1 15 8 4 5 11 7 10 13 0 2 12 6 59
+10 9 3 11 0 13 2 14 5 6 4 7 8 15 1 12 49
+7 3 14 13 4 1 10 8 5 12 9 11 2 15 6 0 54
+11 4 2 7 1 0 10 15 6 9 14 8 3 13 5 12 52
+5 7 3 12 15 13 14 8 0 10 9 6 1 4 2 11 58
+14 1 8 15 2 6 0 3 9 12 10 13 4 7 5 11 53
+13 14 6 12 4 5 1 0 9 3 10 2 15 11 8 7 52
+9 8 0 2 15 1 4 14 3 10 7 5 11 13 6 12 54
+12 15 2 6 1 14 4 8 5 3 7 0 10 13 9 11 47
+12 8 15 13 1 0 5 4 6 3 2 11 9 7 14 10 50
+14 10 9 4 13 6 5 8 2 12 7 0 1 3 11 15 59
+14 3 5 15 11 6 13 9 0 10 2 12 4 1 7 8 60
+6 11 7 8 13 2 5 4 1 10 3 9 14 0 12 15 52
+1 6 12 14 3 2 15 8 4 5 13 9 0 7 11 10 55
+12 6 0 4 7 3 15 1 13 9 8 11 2 14 5 10 52
+8 1 7 12 11 0 10 5 9 15 6 13 14 2 3 4 58
+7 15 8 2 13 6 3 12 11 0 4 10 9 5 1 14 53
+9 0 4 10 1 14 15 3 12 6 5 7 11 13 8 2 49
+11 5 1 14 4 12 10 0 2 7 13 3 9 15 6 8 54
+8 13 10 9 11 3 15 6 0 1 2 14 12 5 4 7 54
+4 5 7 2 9 14 12 13 0 3 6 11 8 1 15 10 42
+11 15 14 13 1 9 10 4 3 6 2 12 7 5 8 0 64
+12 9 0 6 8 3 5 14 2 4 11 7 10 1 15 13 50
+3 14 9 7 12 15 0 4 1 8 5 6 11 10 2 13 51
+8 4 6 1 14 12 2 15 13 10 9 5 3 7 0 11 49
+6 10 1 14 15 8 3 5 13 0 2 7 4 9 11 12 47
+8 11 4 6 7 3 10 9 2 12 15 13 0 1 5 14 49
+10 0 2 4 5 1 6 12 11 13 9 7 15 3 14 8 59
+12 5 13 11 2 10 0 9 7 8 4 3 14 6 15 1 53
+10 2 8 4 15 0 1 14 11 13 3 6 9 7 5 12 56
+10 8 0 12 3 7 6 2 1 14 4 11 15 13 9 5 56
+14 9 12 13 15 4 8 10 0 2 1 7 3 11 5 6 64
+12 11 0 8 10 2 13 15 5 4 7 3 6 9 14 1 56
+13 8 14 3 9 1 0 7 15 5 4 10 12 2 6 11 41
+3 15 2 5 11 6 4 7 12 9 1 0 13 14 10 8 55
+5 11 6 9 4 13 12 0 8 2 15 10 1 7 3 14 50
+5 0 15 8 4 6 1 14 10 11 3 9 7 12 2 13 51
+15 14 6 7 10 1 0 11 12 8 4 9 2 5 13 3 57
+11 14 13 1 2 3 12 4 15 7 9 5 10 6 8 0 66
+6 13 3 2 11 9 5 10 1 7 12 14 8 4 0 15 45
+4 6 12 0 14 2 9 13 11 8 3 15 7 10 1 5 57
+8 10 9 11 14 1 7 15 13 4 0 12 6 2 5 3 56
+5 2 14 0 7 8 6 3 11 12 13 15 4 10 9 1 51
+7 8 3 2 10 12 4 6 11 13 5 15 0 1 9 14 47
+11 6 14 12 3 5 1 15 8 0 10 13 9 7 4 2 61
+7 1 2 4 8 3 6 11 10 15 0 5 14 12 13 9 50
+7 3 1 13 12 10 5 2 8 0 6 11 14 15 4 9 51
+6 0 5 15 1 14 4 9 2 13 8 10 11 12 7 3 53
+15 1 3 12 4 0 6 5 2 8 14 9 13 10 7 11 52
+5 7 0 11 12 1 9 10 15 6 2 3 8 4 13 14 44
+12 15 11 10 4 5 14 0 13 7 1 2 9 8 3 6 56
+6 14 10 5 15 8 7 1 3 4 2 0 12 9 11 13 49
+14 13 4 11 15 8 6 9 0 7 3 1 2 10 12 5 56
+14 4 0 10 6 5 1 3 9 2 13 15 12 7 8 11 48
+15 10 8 3 0 6 9 5 1 14 13 11 7 2 12 4 57
+0 13 2 4 12 14 6 9 15 1 10 3 11 5 8 7 54
+3 14 13 6 4 15 8 9 5 12 10 0 2 7 1 11 53
+0 1 9 7 11 13 5 3 14 12 4 2 8 6 10 15 42
+11 0 15 8 13 12 3 5 10 1 4 6 14 9 7 2 57
+13 0 9 12 11 6 3 5 15 8 1 10 4 14 2 7 53
+14 10 2 1 13 9 8 11 7 3 6 12 15 5 4 0 62
+12 3 9 1 4 5 10 2 6 11 15 0 14 7 13 8 49
+15 8 10 7 0 12 14 1 5 9 6 3 13 11 4 2 55
+4 7 13 10 1 2 9 6 12 8 14 5 3 0 11 15 44
+6 0 5 10 11 12 9 2 1 7 4 3 14 8 13 15 45
+9 5 11 10 13 0 2 1 8 6 14 12 4 7 3 15 52
+15 2 12 11 14 13 9 5 1 3 8 7 0 10 6 4 65
+11 1 7 4 10 13 3 8 9 14 0 15 6 5 2 12 54
+5 4 7 1 11 12 14 15 10 13 8 6 2 0 9 3 50
+9 7 5 2 14 15 12 10 11 3 6 1 8 13 0 4 57
+3 2 7 9 0 15 12 4 6 11 5 14 8 13 10 1 57
+13 9 14 6 12 8 1 2 3 4 0 7 5 10 11 15 46
+5 7 11 8 0 14 9 13 10 12 3 15 6 1 4 2 53
+4 3 6 13 7 15 9 0 10 5 8 11 2 12 1 14 50
+1 7 15 14 2 6 4 9 12 11 13 3 0 8 5 10 49
+9 14 5 7 8 15 1 2 10 4 13 6 12 0 11 3 44
+0 11 3 12 5 2 1 9 8 10 14 15 7 4 13 6 54
+7 15 4 0 10 9 2 5 12 11 13 6 1 3 14 8 57
+11 4 0 8 6 10 5 13 12 7 14 3 1 2 9 15 54
+"""
+BENCH_WALK_DEPTHS = (10, 20, 40, 80)
+_BENCH_WALKS_PER_DEPTH = 10
+# Suites par défaut : chaque instance tient largement dans le délai
+BENCH_DEFAULT_SUITES = ("walk-10", "walk-20", "walk-40")
+# Écarts absolus en dessous desquels temps et mémoire sont du bruit de mesure
+_BENCH_NOISE_FLOOR = {"time_ms": 50.0, "peak_rss_mb": 5.0}
+
+
+def korf_instances() -> List[Tuple[State, Optional[int]]]:
+    # Demi-tour du plateau et tuile v -> 16 - v : mêmes distances, mais vers
+    # notre but (vide en bas à droite)
+    instances: List[Tuple[State, Optional[int]]] = []
+    for line in _KORF_100.strip().splitlines():
+        values = [int(v) for v in line.split()]
+        flat = [0 if v == 0 else 16 - v for v in reversed(values[:16])]
+        state = tuple(tuple(flat[i * 4 : i * 4 + 4]) for i in range(4))
+        instances.append((state, values[16]))
+    return instances
+
+
+def random_walk(depth: int, seed: int, rows: int = 4, cols: int = 4) -> State:
+    # Marche aléatoire sans retour arrière depuis le but, à graine fixe
+    board = _board(rows, cols)
+    rng = random.Random(seed)
+    current, blank = board.pack(board.goal_state)
+    prev = -1
+    for _ in range(depth):
+        nb = rng.choice([n for n in board.neighbors[blank] if n != prev])
+        tile = (current >> board.shifts[nb]) & board.mask
+        current += (tile << board.shifts[blank]) - (tile << board.shifts[nb])
+        prev, blank = blank, nb
+    return board.unpack(current)
+
+
+def benchmark_suites(
+    rows: int = 4, cols: int = 4
+) -> Dict[str, List[Tuple[State, Optional[int]]]]:
+    # Nom -> [(instance, longueur optimale si connue)]
+    suites: Dict[str, List[Tuple[State, Optional[int]]]] = {}
+    if (rows, cols) == (4, 4):
+        suites["korf100"] = korf_instances()
+    for depth in BENCH_WALK_DEPTHS:
+        suites[f"walk-{depth}"] = [
+            (random_walk(depth, seed, rows, cols), None)
+            for seed in range(_BENCH_WALKS_PER_DEPTH)
+        ]
+    return suites
+
+
+def _peak_rss_mb() -> Optional[float]:
+    if resource is None:
+        return None
+    peak = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+    # Kio sous Linux, octets sous macOS
+    return peak / (1024 * 1024) if sys.platform == "darwin" else peak / 1024
+
+
+def _bench_instance(
+    state: State,
+    heuristic: str,
+    algorithm: str,
+    weight: float,
+    timeout: Optional[float],
+    memory_limit_mb: Optional[float],
+) -> Dict[str, Any]:
+    # Exécuté dans un processus neuf : le pic de RSS est celui de l'instance
+    wall_start = time.perf_counter()
+    result = _solve_instance(
+        0, state, heuristic, algorithm, weight, timeout, memory_limit_mb, True
+    )
+    wall_ms = (time.perf_counter() - wall_start) * 1000
+    record: Dict[str, Any] = {"success": result["success"], "wall_ms": wall_ms}
+    if result["success"]:
+        record["moves"] = len(result["moves"])
+        record["nodes"] = result["nodes"]
+        record["time_ms"] = result["time"]
+        record["nodes_per_sec"] = result["nodes"] / max(result["time"], 1e-3) * 1000
+    else:
+        record["message"] = result["message"]
+    record["peak_rss_mb"] = _peak_rss_mb()
+    return record
+
+
+def run_benchmark(
+    suites: Iterable[str],
+    algorithms: Iterable[str],
+    heuristics: Iterable[str],
+    weight: float = 1.5,
+    timeout: Optional[float] = None,
+    memory_limit_mb: Optional[float] = None,
+    pdb_path: Optional[str] = None,
+    rows: int = 4,
+    cols: int = 4,
+    limit: Optional[int] = None,
+    workers: int = 1,
+    log: Optional[Callable[[str], None]] = None,
+) -> Dict[str, Any]:
+    # Chaque couple algorithme/heuristique sur chaque suite ; une instance par
+    # processus (max_tasks_per_child=1) pour un RSS propre. Par défaut un seul
+    # processus à la fois : les temps ne se disputent pas les cœurs.
+    available = benchmark_suites(rows, cols)
+    algorithms, heuristics = list(algorithms), list(heuristics)
+    runs: List[Dict[str, Any]] = []
+    summary: Dict[str, Dict[str, Any]] = {}
+    with ProcessPoolExecutor(
+        max_workers=workers,
+        initializer=_init_worker,
+        initargs=(pdb_path, rows, cols),
+        max_tasks_per_child=1,
+    ) as pool:
+        for suite in suites:
+            instances = available[suite][:limit]
+            for algorithm in algorithms:
+                for heuristic in heuristics:
+                    key = f"{suite}/{algorithm}/{heuristic}"
+                    futures = [
+                        pool.submit(
+                            _bench_instance,
+                            state,
+                            heuristic,
+                            algorithm,
+                            weight,
+                            timeout,
+                            memory_limit_mb,
+                        )
+                        for state, _ in instances
+                    ]
+                    records = []
+                    for index, future in enumerate(futures):
+                        record = future.result()
+                        expected = instances[index][1]
+                        record.update(
+                            suite=suite,
+                            algorithm=algorithm,
+                            heuristic=heuristic,
+                            index=index,
+                        )
+                        if expected is not None and record["success"]:
+                            record["optimal"] = record["moves"] == expected
+                        records.append(record)
+                        if log is not None:
+                            log(_format_run(record))
+                    runs.extend(records)
+                    summary[key] = _summarize(records)
+    return {
+        "meta": {
+            "python": sys.version.split()[0],
+            "platform": sys.platform,
+            "date": time.strftime("%Y-%m-%dT%H:%M:%S"),
+            "rows": rows,
+            "cols": cols,
+            "weight": weight,
+            "timeout": timeout,
+            "limit": limit,
+        },
+        "summary": summary,
+        "runs": runs,
+    }
+
+
+def _format_run(record: Dict[str, Any]) -> str:
+    name = f"{record['suite']}/{record['algorithm']}/{record['heuristic']}"
+    if not record["success"]:
+        return f"{name} #{record['index']} : {record['message']}"
+    return (
+        f"{name} #{record['index']} : {record['moves']} coups, "
+        f"{record['nodes']:,} nœuds, {record['time_ms']:.0f} ms"
+    )
+
+
+def _summarize(records: List[Dict[str, Any]]) -> Dict[str, Any]:
+    solved = [r for r in records if r["success"]]
+    nodes = sum(r["nodes"] for r in solved)
+    time_ms = sum(r["time_ms"] for r in solved)
+    peaks = [r["peak_rss_mb"] for r in records if r["peak_rss_mb"] is not None]
+    return {
+        "instances": len(records),
+        "solved": len(solved),
+        "not_optimal": sum(1 for r in solved if r.get("optimal") is False),
+        "moves": sum(r["moves"] for r in solved),
+        "nodes": nodes,
+        "time_ms": time_ms,
+        "wall_ms": sum(r["wall_ms"] for r in records),
+        "nodes_per_sec": nodes / max(time_ms, 1e-3) * 1000,
+        "peak_rss_mb": max(peaks) if peaks else None,
+    }
+
+
+def compare_benchmarks(
+    baseline: Dict[str, Any], current: Dict[str, Any], tolerance: float = 0.10
+) -> List[str]:
+    # Régressions de current par rapport à baseline, sur les mêmes suites
+    # (même nombre d'instances). Nœuds, temps et mémoire ne se comparent qu'à
+    # nombre d'instances résolues égal ; temps et mémoire doivent en plus
+    # dépasser le plancher de bruit _BENCH_NOISE_FLOOR en valeur absolue.
+    regressions = []
+    for key, now in current["summary"].items():
+        before = baseline["summary"].get(key)
+        if before is None or before["instances"] != now["instances"]:
+            continue
+        if now["not_optimal"] > before["not_optimal"]:
+            regressions.append(f"{key} : {now['not_optimal']} solutions non optimales")
+        if now["solved"] < before["solved"]:
+            regressions.append(
+                f"{key} : {now['solved']} résolues au lieu de {before['solved']}"
+            )
+            continue
+        if now["solved"] != before["solved"]:
+            continue
+        checks = [("nodes", "nœuds", ",.0f"), ("time_ms", "temps (ms)", ",.0f")]
+        if now["peak_rss_mb"] is not None and before["peak_rss_mb"] is not None:
+            checks.append(("peak_rss_mb", "pic RSS (Mo)", ",.1f"))
+        for field, label, fmt in checks:
+            if now[field] - before[field] <= _BENCH_NOISE_FLOOR.get(field, 0.0):
+                continue
+            if now[field] > before[field] * (1 + tolerance):
+                regressions.append(
+                    f"{key} : {label} {before[field]:{fmt}} -> {now[field]:{fmt}} "
+                    f"(+{(now[field] / max(before[field], 1e-9) - 1) * 100:.0f} %)"
+                )
+    return regressions
+
 
 class TaquinGUI:
     def __init__(self, root: tk.Tk) -> None:
@@ -145,15 +2352,19 @@ class TaquinGUI:
         self.root.geometry("1000x750")
         self.root.configure(bg="#f0f2f5")
 
-        self.solver = TaquinSolver()
-        self.grid: List[List[int]] = [
-            [1, 2, 3, 4],
-            [5, 6, 7, 8],
-            [9, 10, 11, 12],
-            [13, 14, 0, 15],
-        ]
+        # Cache sur disque partagé par toutes les tailles de grille
+        try:
+            self.cache = SolutionCache(path=CACHE_DEFAULT_PATH)
+        except (OSError, dbm.error):
+            self.cache = SolutionCache()
+        self.root.protocol("WM_DELETE_WINDOW", self.on_close)
+
+        self.solver = TaquinSolver(cache=self.cache)
+        self.grid: List[List[int]] = self._near_goal_grid()
         self.edit_mode: bool = False
         self.is_running: bool = False  # Calcul en cours ?
+        # Métriques du thread de calcul, relevées par root.after
+        self.progress_queue: "queue.Queue[Dict[str, Any]]" = queue.Queue()
 
         self.setup_ui()
         self.update_grid_display()
@@ -174,22 +2385,7 @@ class TaquinGUI:
         self.grid_frame.pack()
 
         self.btn_matrix: List[List[tk.Label]] = []
-        for i in range(4):
-            row_btns = []
-            for j in range(4):
-                lbl = tk.Label(
-                    self.grid_frame,
-                    text="",
-                    width=5,
-                    height=2,
-                    font=("Arial", 24, "bold"),
-                    fg="white",
-                    bd=0,
-                )
-                lbl.grid(row=i, column=j, padx=5, pady=5)
-                lbl.bind("<Button-1>", lambda e, r=i, c=j: self.on_cell_click(r, c))
-                row_btns.append(lbl)
-            self.btn_matrix.append(row_btns)
+        self.build_grid()
 
         # Actions
         btn_box = ttk.Frame(left_panel, padding=15)
@@ -219,6 +2415,18 @@ class TaquinGUI:
         )
         right_panel.pack(side="right", fill="both", expand=True)
 
+        ttk.Label(right_panel, text="Taille (lignes x colonnes):").pack(anchor="w")
+        self.size_var = tk.StringVar(value="4x4")
+        size_box = ttk.Combobox(
+            right_panel,
+            textvariable=self.size_var,
+            values=("3x3", "4x4", "5x5", "3x4", "4x5"),
+            state="readonly",
+            width=8,
+        )
+        size_box.pack(anchor="w", pady=(0, 10))
+        size_box.bind("<<ComboboxSelected>>", self.change_size)
+
         ttk.Label(right_panel, text="Algorithme:").pack(anchor="w")
         self.algo_var = tk.StringVar(value="astar")
         ttk.Radiobutton(
@@ -230,6 +2438,30 @@ class TaquinGUI:
             variable=self.algo_var,
             value="wastar",
         ).pack(anchor="w")
+        ttk.Radiobutton(
+            right_panel,
+            text="IDA* (Mémoire bornée)",
+            variable=self.algo_var,
+            value="idastar",
+        ).pack(anchor="w")
+        ttk.Radiobutton(
+            right_panel,
+            text="IDA* parallèle (Multi-cœurs)",
+            variable=self.algo_var,
+            value="parallel_idastar",
+        ).pack(anchor="w")
+        ttk.Radiobutton(
+            right_panel,
+            text="ARA* (Anytime, poids WA* initial)",
+            variable=self.algo_var,
+            value="anytime",
+        ).pack(anchor="w")
+        ttk.Radiobutton(
+            right_panel,
+            text="Bidirectionnel BAE* (Optimal)",
+            variable=self.algo_var,
+            value="bidirectional",
+        ).pack(anchor="w")
 
         ttk.Label(right_panel, text="\nPoids WA* (1.0 - 5.0):").pack(anchor="w")
         self.weight_var = tk.DoubleVar(value=1.5)
@@ -252,6 +2484,24 @@ class TaquinGUI:
         ttk.Radiobutton(
             right_panel, text="Mal placés", variable=self.heur_var, value="misplaced"
         ).pack(anchor="w")
+        ttk.Radiobutton(
+            right_panel,
+            text="Conflits linéaires",
+            variable=self.heur_var,
+            value="linear_conflict",
+        ).pack(anchor="w")
+        ttk.Radiobutton(
+            right_panel,
+            text="Walking distance",
+            variable=self.heur_var,
+            value="walking_distance",
+        ).pack(anchor="w")
+        ttk.Radiobutton(
+            right_panel,
+            text="Bases de motifs (PDB)",
+            variable=self.heur_var,
+            value="pdb",
+        ).pack(anchor="w")
 
         # BOUTONS DE CONTRÔLE
         self.solve_btn = tk.Button(
@@ -279,6 +2529,11 @@ class TaquinGUI:
         self.stop_btn.pack(fill="x", pady=5)
         self.stop_btn.config(state="disabled")  # Désactivé par défaut
 
+        self.stats_var = tk.StringVar(value="")
+        ttk.Label(
+            right_panel, textvariable=self.stats_var, font=("Consolas", 9)
+        ).pack(anchor="w")
+
         self.log_box = tk.Text(
             right_panel,
             height=12,
@@ -289,30 +2544,74 @@ class TaquinGUI:
         )
         self.log_box.pack(fill="both", expand=True, pady=15)
 
-    def update_grid_display(self) -> None:
-        for i in range(4):
-            for j in range(4):
-                val = self.grid[i][j]
-                lbl = self.btn_matrix[i][j]
-                if val == 0:
-                    lbl.config(text="", bg="#cdc1b4")
-                else:
-                    lbl.config(
-                        text=str(val),
-                        bg="#edc22e" if val > 8 else "#eee4da",
-                        fg="white" if val > 8 else "#776e65",
-                    )
-                lbl.config(
-                    highlightthickness=2 if self.edit_mode else 0,
-                    highlightbackground="#e74c3c",
+    def build_grid(self) -> None:
+        for widget in self.grid_frame.winfo_children():
+            widget.destroy()
+        self.btn_matrix = []
+        for i in range(self.solver.rows):
+            row_btns = []
+            for j in range(self.solver.cols):
+                lbl = tk.Label(
+                    self.grid_frame,
+                    text="",
+                    width=5,
+                    height=2,
+                    font=("Arial", 24, "bold"),
+                    fg="white",
+                    bd=0,
                 )
+                lbl.grid(row=i, column=j, padx=5, pady=5)
+                lbl.bind("<Button-1>", lambda e, r=i, c=j: self.on_cell_click(r, c))
+                row_btns.append(lbl)
+            self.btn_matrix.append(row_btns)
+
+    def _near_goal_grid(self) -> List[List[int]]:
+        # But avec les deux dernières cases échangées (grille de départ)
+        grid = [list(row) for row in self.solver.goal_state]
+        grid[-1][-1], grid[-1][-2] = grid[-1][-2], grid[-1][-1]
+        return grid
+
+    def change_size(self, event: Any = None) -> None:
+        if self.is_running:
+            return
+        rows, cols = (int(v) for v in self.size_var.get().split("x"))
+        self.solver = TaquinSolver(rows=rows, cols=cols, cache=self.cache)
+        self.grid = self._near_goal_grid()
+        self.edit_mode = False
+        self.edit_btn.config(text="✏️ Mode Édition", bg="#3498db")
+        self.build_grid()
+        self.update_grid_display()
+        self.log(f"Grille {rows}×{cols}.")
+
+    def update_grid_display(self) -> None:
+        for i in range(self.solver.rows):
+            for j in range(self.solver.cols):
+                self._paint_cell(i, j)
+
+    def _paint_cell(self, i: int, j: int) -> None:
+        half = self.solver.rows * self.solver.cols // 2
+        val = self.grid[i][j]
+        lbl = self.btn_matrix[i][j]
+        if val == 0:
+            lbl.config(text="", bg="#cdc1b4")
+        else:
+            lbl.config(
+                text=str(val),
+                bg="#edc22e" if val > half else "#eee4da",
+                fg="white" if val > half else "#776e65",
+            )
+        lbl.config(
+            highlightthickness=2 if self.edit_mode else 0,
+            highlightbackground="#e74c3c",
+        )
 
     def on_cell_click(self, r: int, c: int) -> None:
         if self.is_running:
             return
         if self.edit_mode:
+            top = self.solver.rows * self.solver.cols - 1
             res = simpledialog.askinteger(
-                "Édition", "Valeur (0-15):", minvalue=0, maxvalue=15
+                "Édition", f"Valeur (0-{top}):", minvalue=0, maxvalue=top
             )
             if res is not None:
                 self.grid[r][c] = res
@@ -320,8 +2619,8 @@ class TaquinGUI:
         else:
             # Recherche du vide
             zr, zc = -1, -1
-            for i in range(4):
-                for j in range(4):
+            for i in range(self.solver.rows):
+                for j in range(self.solver.cols):
                     if self.grid[i][j] == 0:
                         zr, zc = i, j
             if abs(r - zr) + abs(c - zc) == 1:
@@ -331,10 +2630,11 @@ class TaquinGUI:
     def toggle_edit_mode(self) -> None:
         if self.edit_mode:
             flat = [v for r in self.grid for v in r]
-            if sorted(flat) != list(range(16)):
+            if sorted(flat) != list(range(len(flat))):
                 messagebox.showerror(
                     "Erreur",
-                    "La grille doit contenir les chiffres de 0 à 15 sans doublons.",
+                    f"La grille doit contenir les chiffres de 0 à {len(flat) - 1} "
+                    "sans doublons.",
                 )
                 return
             self.edit_mode = False
@@ -367,6 +2667,7 @@ class TaquinGUI:
         thread = threading.Thread(target=self._run_solver, args=(start_state,))
         thread.daemon = True  # Le thread s'arrête si on ferme la fenêtre
         thread.start()
+        self.root.after(200, self._poll_progress)
 
     def _run_solver(self, start_state: State) -> None:
         # Cette fonction tourne en tâche de fond
@@ -375,47 +2676,95 @@ class TaquinGUI:
             heuristic=self.heur_var.get(),
             algorithm=self.algo_var.get(),
             weight=self.weight_var.get(),
+            progress=self.progress_queue.put,
+            progress_every=20000,
+            on_solution=lambda sol: self.progress_queue.put({"solution": sol}),
+            as_moves=True,
         )
 
         # On renvoie le résultat au thread principal de l'UI
         self.root.after(0, lambda: self._handle_result(result))
 
+    def _poll_progress(self) -> None:
+        # Solutions intermédiaires (ARA*) journalisées ; seule la dernière
+        # mesure est affichée
+        stats = None
+        while not self.progress_queue.empty():
+            item = self.progress_queue.get_nowait()
+            if "solution" in item:
+                sol = item["solution"]
+                self.log(
+                    f"Solution : {sol['cost']} coups (poids {sol['weight']:g}, "
+                    f"≤ {sol['bound']:.2f} × optimal)"
+                )
+            else:
+                stats = item
+        if stats is not None:
+            self.stats_var.set(
+                f"{stats['nodes']:,} nœuds  {stats['nodes_per_sec']:,.0f}/s\n"
+                f"ouverts {stats['open']:,}  connus {stats['closed']:,}\n"
+                f"f = {stats['best_f']:g}  ~{stats['memory_mb']:.1f} Mo"
+            )
+        if self.is_running:
+            self.root.after(200, self._poll_progress)
+
     def _handle_result(self, result: Dict[str, Any]) -> None:
         self.is_running = False
         self.solve_btn.config(state="normal", bg="#2ecc71")
         self.stop_btn.config(state="disabled")
 
         if result["success"]:
-            self.log(f"Solution trouvée ! ({len(result['path'])-1} coups)")
-            self._animate(result["path"])
+            origin = " depuis le cache" if result.get("cached") else ""
+            self.log(f"Solution trouvée{origin} ! ({len(result['moves'])} coups)")
+            self._animate(result["moves"])
         else:
             self.log(result["message"])
             messagebox.showinfo("Résultat", result["message"])
 
+    def on_close(self) -> None:
+        self.solver.request_stop()
+        self.cache.close()
+        self.root.destroy()
+
     def stop_solving(self) -> None:
         self.log("Demande d'arrêt envoyée...")
         self.solver.request_stop()
 
-    def _animate(self, path: List[State]) -> None:
-        if not path:
+    def _animate(
+        self, moves: str, index: int = 0, blank: Optional[Tuple[int, int]] = None
+    ) -> None:
+        # Un coup par pas : seules les deux cases échangées sont redessinées
+        if index >= len(moves):
             return
-        self.grid = [list(row) for row in path.pop(0)]
-        self.update_grid_display()
-        self.root.after(150, lambda: self._animate(path))
+        if blank is None:
+            blank = next(
+                (i, j)
+                for i, row in enumerate(self.grid)
+                for j, val in enumerate(row)
+                if val == 0
+            )
+        r, c = blank
+        dr, dc = _MOVE_DELTAS[MOVE_LETTERS.index(moves[index])]
+        self.grid[r][c], self.grid[r + dr][c + dc] = self.grid[r + dr][c + dc], 0
+        self._paint_cell(r, c)
+        self._paint_cell(r + dr, c + dc)
+        self.root.after(
+            150, lambda: self._animate(moves, index + 1, (r + dr, c + dc))
+        )
 
     def shuffle(self) -> None:
         if self.is_running:
             return
         for _ in range(100):
             r, c = -1, -1
-            for i in range(4):
-                for j in range(4):
+            for i in range(self.solver.rows):
+                for j in range(self.solver.cols):
                     if self.grid[i][j] == 0:
                         r, c = i, j
             # Mouvement aléatoire valide
             moves = [(-1, 0), (1, 0), (0, -1), (0, 1)]
             dr, dc = random.choice(moves)
-            if 0 <= r + dr < 4 and 0 <= c + dc < 4:
+            if 0 <= r + dr < self.solver.rows and 0 <= c + dc < self.solver.cols:
                 self.grid[r][c], self.grid[r + dr][c + dc] = (
                     self.grid[r + dr][c + dc],
                     self.grid[r][c],
@@ -425,11 +2774,139 @@ class TaquinGUI:
     def reset(self) -> None:
         if self.is_running:
             return
-        self.grid = [[1, 2, 3, 4], [5, 6, 7, 8], [9, 10, 11, 12], [13, 14, 15, 0]]
+        self.grid = [list(row) for row in self.solver.goal_state]
         self.update_grid_display()
 
 
 if __name__ == "__main__":
-    root = tk.Tk()
-    app = TaquinGUI(root)
-    root.mainloop()
+    parser = argparse.ArgumentParser(description="Taquin 15 : interface et outils")
+    commands = parser.add_subparsers(dest="command")
+    build_cmd = commands.add_parser(
+        "build-pdb",
+        help="Construire les bases de motifs additives (hors ligne)",
+        description="6-6-3 : environ 4 min et 190 Mo de RSS sur un cœur, "
+        "fichier de 32 Mo ; 5-5-5 : environ 30 s.",
+    )
+    build_cmd.add_argument(
+        "--partition",
+        default="6-6-3",
+        help="Nom prédéfini (6-6-3, 5-5-5) ou motifs explicites 1,2,3/4,5,6/...",
+    )
+    build_cmd.add_argument("--output", default=PDB_DEFAULT_PATH)
+    batch_cmd = commands.add_parser(
+        "batch", help="Résoudre un fichier d'instances, résultats en JSON lines"
+    )
+    batch_cmd.add_argument("instances", help="Fichier d'instances ('-' : stdin)")
+    batch_cmd.add_argument("--heuristic", default="manhattan")
+    batch_cmd.add_argument("--algorithm", default="astar")
+    batch_cmd.add_argument("--weight", type=float, default=1.5)
+    batch_cmd.add_argument("--workers", type=int, default=None)
+    batch_cmd.add_argument(
+        "--timeout", type=float, default=None, help="Secondes par instance"
+    )
+    batch_cmd.add_argument("--pdb", default=None, help="Fichier PDB")
+    batch_cmd.add_argument(
+        "--memory-limit", type=float, default=None, help="Mo par instance (hors IDA*)"
+    )
+    batch_cmd.add_argument("--rows", type=int, default=4)
+    batch_cmd.add_argument("--cols", type=int, default=4)
+    batch_cmd.add_argument(
+        "--moves", action="store_true", help="Solutions en chaîne U/D/L/R"
+    )
+    bench_cmd = commands.add_parser(
+        "bench", help="Banc d'essai : mesures JSON et comparaison à une référence"
+    )
+    bench_cmd.add_argument(
+        "--suite",
+        action="append",
+        help="korf100, walk-10, walk-20, walk-40, walk-80 (répétable ; "
+        f"défaut : {', '.join(BENCH_DEFAULT_SUITES)})",
+    )
+    bench_cmd.add_argument("--algorithm", nargs="+", default=["astar", "idastar"])
+    bench_cmd.add_argument(
+        "--heuristic", nargs="+", default=["manhattan", "linear_conflict"]
+    )
+    bench_cmd.add_argument("--weight", type=float, default=1.5)
+    bench_cmd.add_argument(
+        "--limit", type=int, default=None, help="Premières instances par suite"
+    )
+    bench_cmd.add_argument(
+        "--timeout", type=float, default=60.0, help="Secondes par instance"
+    )
+    bench_cmd.add_argument(
+        "--memory-limit", type=float, default=None, help="Mo par instance (hors IDA*)"
+    )
+    bench_cmd.add_argument("--pdb", default=None, help="Fichier PDB")
+    bench_cmd.add_argument("--workers", type=int, default=1)
+    bench_cmd.add_argument("--rows", type=int, default=4)
+    bench_cmd.add_argument("--cols", type=int, default=4)
+    bench_cmd.add_argument("--output", default=None, help="JSON (défaut : stdout)")
+    bench_cmd.add_argument("--baseline", default=None, help="JSON de référence")
+    bench_cmd.add_argument(
+        "--tolerance", type=float, default=0.10, help="Hausse tolérée (0.10 = 10 %%)"
+    )
+    args = parser.parse_args()
+
+    if args.command == "build-pdb":
+        build_pattern_database(
+            args.partition,
+            args.output,
+            progress=lambda info: print(
+                f"Motif {info['pattern']} : {info['time']:.1f} s", flush=True
+            ),
+        )
+    elif args.command == "batch":
+        if args.instances == "-":
+            instances = parse_instances(sys.stdin, args.rows, args.cols)
+        else:
+            with open(args.instances) as f:
+                instances = parse_instances(f, args.rows, args.cols)
+        for result in solve_many(
+            instances,
+            heuristic=args.heuristic,
+            algorithm=args.algorithm,
+            weight=args.weight,
+            workers=args.workers,
+            timeout=args.timeout,
+            pdb_path=args.pdb,
+            rows=args.rows,
+            cols=args.cols,
+            memory_limit_mb=args.memory_limit,
+            as_moves=args.moves,
+        ):
+            print(json.dumps(result, ensure_ascii=False), flush=True)
+    elif args.command == "bench":
+        suites = args.suite or list(BENCH_DEFAULT_SUITES)
+        unknown = set(suites) - set(benchmark_suites(args.rows, args.cols))
+        if unknown:
+            parser.error(f"suite inconnue : {', '.join(sorted(unknown))}")
+        report = run_benchmark(
+            suites,
+            args.algorithm,
+            args.heuristic,
+            weight=args.weight,
+            timeout=args.timeout,
+            memory_limit_mb=args.memory_limit,
+            pdb_path=args.pdb,
+            rows=args.rows,
+            cols=args.cols,
+            limit=args.limit,
+            workers=args.workers,
+            log=lambda line: print(line, file=sys.stderr, flush=True),
+        )
+        text = json.dumps(report, ensure_ascii=False, indent=2)
+        if args.output is None:
+            print(text)
+        else:
+            with open(args.output, "w") as f:
+                f.write(text + "\n")
+        if args.baseline is not None:
+            with open(args.baseline) as f:
+                regressions = compare_benchmarks(json.load(f), report, args.tolerance)
+            for line in regressions:
+                print(f"RÉGRESSION {line}", file=sys.stderr)
+            sys.exit(1 if regressions else 0)
+    else:
+        root = tk.Tk()
+        app = TaquinGUI(root)
+        root.mainloop()
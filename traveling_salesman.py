@@ -6,11 +6,29 @@ Enhanced GUI with improved ergonomics and visual feedback
 
 from __future__ import annotations
 import tkinter as tk
-from tkinter import ttk, messagebox
+from tkinter import ttk, messagebox, filedialog
 from tkinter.scrolledtext import ScrolledText
+import hashlib
+import heapq
 import itertools
+import json
+import math
+import multiprocessing
+import os
 import time
 import random
+import tempfile
+from array import array
+from collections import deque
+from concurrent.futures import ProcessPoolExecutor
+from multiprocessing import shared_memory
+from typing import Any, Callable, Iterable, Iterator
+from operator import add
+
+try:
+    import numpy as np
+except ImportError:  # Optional: only the vectorized Held-Karp engine needs it
+    np = None
 
 # =============================================================================
 # ALGORITHMS
@@ -74,81 +92,1776 @@ def tsp_exact(dist: list[list[float]]) -> tuple[float, list[int]]:
     return best_cost, path
 
 
-def tsp_held_karp(dist: list[list[float]]) -> tuple[float, list[int]]:
+def tsp_exact_dfs(
+    dist: list[list[float]], workers: int | None = None
+) -> tuple[float, list[int]]:
     """
-    TSP solution using Bellman-Held-Karp dynamic programming.
-    Complexity: O(n² × 2ⁿ)
+    Exact TSP by depth-first enumeration with pruning.
+    Complexity: O(n!) worst case, far less in practice
+
+    Tours are grown city by city from city 0 with the cost kept
+    incrementally. A prefix is cut as soon as its cost plus the cheapest
+    entry into every city still to visit (and back into city 0) reaches the
+    best tour found so far. On symmetric matrices each tour is only visited
+    in the direction where the second city is below the last one. The
+    subtrees under each second city are independent and, from
+    PARALLEL_EXACT_MIN_CITIES on, run in separate processes that share the
+    best cost found so far.
 
     Args:
         dist: Distance matrix where dist[i][j] is distance from city i to j
+        workers: Number of processes (default: all cores, 1 to stay serial)
 
     Returns:
         (min_cost, optimal_path) where path starts and ends at city 0
     """
-    n = len(dist)
+    n: int = len(dist)
     if n == 0:
         return 0.0, []
     if n == 1:
         return 0.0, [0, 0]
 
-    ALL = 1 << n
-
-    # DP[mask][i] = minimum cost to visit cities in mask, end at i
-    DP = [[float("inf")] * n for _ in range(ALL)]
-    parent = [[-1] * n for _ in range(ALL)]
-
-    # Base case: start at city 0
-    DP[1 << 0][0] = 0
+    mirror: bool = n > 2 and _is_symmetric(dist)
+    best_cost: float = float("inf")
+    best_path: list[int] = []
+    if mirror:
+        best_cost, best_path = tsp_local_search(dist)
+
+    seconds: list[int] = sorted(range(1, n), key=dist[0].__getitem__)
+    if mirror:
+        seconds.remove(n - 1)  # No city above it to close the tour with
+    workers = workers or os.cpu_count() or 1
+    if workers == 1 or n < PARALLEL_EXACT_MIN_CITIES:
+        for second in seconds:
+            cost, path = _exact_subtree(dist, second, best_cost, mirror)
+            if cost < best_cost:
+                best_cost, best_path = cost, path
+        return best_cost, best_path
+
+    shared = multiprocessing.Value("d", best_cost)
+    with ProcessPoolExecutor(
+        max_workers=workers, initializer=_exact_attach, initargs=(shared,)
+    ) as pool:
+        futures = [
+            pool.submit(_exact_subtree, dist, second, best_cost, mirror)
+            for second in seconds
+        ]
+        for future in futures:
+            cost, path = future.result()
+            if cost < best_cost:
+                best_cost, best_path = cost, path
+    return best_cost, best_path
+
+
+# Below this size tsp_exact_dfs stays in one process
+PARALLEL_EXACT_MIN_CITIES: int = 11
+
+# Best cost shared by the tsp_exact_dfs workers (set by _exact_attach)
+_exact_shared_best: Any = None
+
+
+def _exact_attach(shared: Any) -> None:
+    """Worker initializer: keep the shared best cost for _exact_subtree."""
+    global _exact_shared_best
+    _exact_shared_best = shared
+
+
+def _exact_subtree(
+    dist: list[list[float]], second: int, bound: float, mirror: bool
+) -> tuple[float, list[int]]:
+    """Best tour starting 0 → second, if one is strictly below bound."""
+    n: int = len(dist)
+    inf: float = float("inf")
+    if dist[0][second] == inf:
+        return inf, []
 
-    # Build DP
-    for mask in range(ALL):
-        for i in range(n):
-            if not (mask & (1 << i)):  # i not in mask
+    # Every city still to visit, and city 0 again, costs at least this much
+    min_in: list[float] = [
+        min(dist[i][j] for i in range(n) if i != j) for j in range(n)
+    ]
+    order: list[list[int]] = [
+        sorted(range(1, n), key=row.__getitem__) for row in dist
+    ]
+    visited: list[bool] = [False] * n
+    visited[0] = visited[second] = True
+    path: list[int] = [0, second]
+    best_cost: float = inf
+    best_path: list[int] = []
+    shared: Any = _exact_shared_best
+
+    def extend(city: int, cost: float, rest: float, above: int) -> None:
+        # above: unvisited cities that may still end the tour (mirror tours)
+        nonlocal bound, best_cost, best_path
+        row: list[float] = dist[city]
+        depth: int = len(path)
+        if depth == n:
+            total: float = cost + row[0]
+            if total < bound:
+                bound = best_cost = total
+                best_path = path + [0]
+                if shared is not None:
+                    with shared.get_lock():
+                        shared.value = min(shared.value, total)
+            return
+        for nxt in order[city]:
+            if visited[nxt]:
                 continue
-            if DP[mask][i] == float("inf"):  # unreachable state
+            if depth == 2 and shared is not None:
+                bound = min(bound, shared.value)
+            left: int = above - (nxt > second)
+            if left == 0 and (depth + 1 < n or nxt < second):
                 continue
+            step: float = cost + row[nxt]
+            remaining: float = rest - min_in[nxt]
+            if step + remaining >= bound:
+                continue
+            visited[nxt] = True
+            path.append(nxt)
+            extend(nxt, step, remaining, left)
+            path.pop()
+            visited[nxt] = False
+
+    extend(
+        second,
+        dist[0][second],
+        sum(min_in) - min_in[second],
+        n - 1 - second if mirror else n,
+    )
+    return best_cost, best_path
+
+
+def tsp_held_karp(
+    dist: list[list[float]], value_type: str = "d"
+) -> tuple[float, list[int]]:
+    """
+    TSP solution using Bellman-Held-Karp dynamic programming.
+    Complexity: O(n² × 2ⁿ) time, (n-1) × 2ⁿ⁻¹ values of memory
 
-            # Try extending to city j
-            for j in range(n):
-                if mask & (1 << j):  # j already visited
-                    continue
+    City 0 is the implicit start, so masks only cover cities 1..n-1 and
+    DP[mask][j] lives at index mask * (n-1) + j of one flat array. Each
+    entry is a min over the previous row, computed in C with map/min.
+    Parents are not stored; the path is recovered by finding, at each
+    step back, the predecessor that achieves the stored cost.
 
-                new_mask = mask | (1 << j)
-                new_cost = DP[mask][i] + dist[i][j]
+    Args:
+        dist: Distance matrix where dist[i][j] is distance from city i to j
+        value_type: array typecode for DP values: "d" (float64) or "f"
+            (float32, half the memory, exact for integer costs below 2²⁴)
 
-                if new_cost < DP[new_mask][j]:
-                    DP[new_mask][j] = new_cost
-                    parent[new_mask][j] = i
+    Returns:
+        (min_cost, optimal_path) where path starts and ends at city 0
+    """
+    n: int = len(dist)
+    if n == 0:
+        return 0.0, []
+    if n == 1:
+        return 0.0, [0, 0]
 
-    # Find best tour ending at any city, then return to 0
-    full = (1 << n) - 1
-    best_cost = float("inf")
-    best_last = None
+    m: int = n - 1  # Cities 1..n-1, bit j of a mask is city j + 1
+    inf: float = float("inf")
+    # into[j][i] = cost from city i + 1 to city j + 1, aligned with a DP row
+    into: list[list[float]] = [[dist[i + 1][j + 1] for i in range(m)] for j in range(m)]
 
-    for i in range(1, n):
-        total = DP[full][i] + dist[i][0]
+    # DP[mask][j] = minimum cost from 0 through mask, ending at city j + 1
+    dp: array = array(value_type, [inf]) * ((1 << m) * m)
+    for j in range(m):
+        dp[(1 << j) * m + j] = dist[0][j + 1]
+
+    for mask in range(3, 1 << m):
+        if mask & (mask - 1) == 0:  # Single cities are the base case
+            continue
+        row: int = mask * m
+        bits: int = mask
+        while bits:
+            low: int = bits & -bits
+            bits ^= low
+            j: int = low.bit_length() - 1
+            prev: int = (mask ^ low) * m
+            # Cities outside prev hold inf, so they never win the min
+            dp[row + j] = min(map(add, dp[prev : prev + m], into[j]))
+
+    # Close the tour back to city 0
+    full: int = (1 << m) - 1
+    best_cost: float = inf
+    best_last: int = -1
+    for j in range(m):
+        total: float = dp[full * m + j] + dist[j + 1][0]
         if total < best_cost:
             best_cost = total
-            best_last = i
+            best_last = j
 
-    if best_last is None:
-        return float("inf"), []
+    if best_last < 0:
+        return inf, []
 
-    # Reconstruct path
-    path = []
+    # Walk back, picking the predecessor that achieves each stored cost
+    path: list[int] = [best_last + 1]
     mask = full
-    curr = best_last
+    j = best_last
+    while mask & (mask - 1):
+        mask ^= 1 << j
+        prev = mask * m
+        j = min(
+            (i for i in range(m) if mask >> i & 1),
+            key=lambda i: dp[prev + i] + into[j][i],
+        )
+        path.append(j + 1)
+
+    path.reverse()
+    return best_cost, [0] + path + [0]
+
+
+def tsp_held_karp_numpy(
+    dist: list[list[float]], value_type: str = "d"
+) -> tuple[float, list[int]]:
+    """
+    Vectorized Bellman-Held-Karp, processing subsets layer by popcount.
+    Complexity: O(n² × 2ⁿ) time in NumPy, O(n²) Python-level operations
+
+    Same table layout as tsp_held_karp (masks over cities 1..n-1). Within a
+    layer every subset depends only on the previous one, so for each end
+    city j all subsets of the layer containing j are filled at once: gather
+    their predecessor rows, add the column into j and reduce with min.
+    Returns the same (cost, path) as tsp_held_karp.
+
+    Args:
+        dist: Distance matrix where dist[i][j] is distance from city i to j
+        value_type: "d" (float64) or "f" (float32, half the memory)
+
+    Returns:
+        (min_cost, optimal_path) where path starts and ends at city 0
+
+    Raises:
+        RuntimeError: If NumPy is not installed
+    """
+    if np is None:
+        raise RuntimeError("NumPy is required for the vectorized Held-Karp engine")
+    n: int = len(dist)
+    if n == 0:
+        return 0.0, []
+    if n == 1:
+        return 0.0, [0, 0]
+
+    m: int = n - 1
+    d, into = _hk_matrices(dist, value_type)
+    dp = np.empty((1 << m, m), dtype=d.dtype)
+    _hk_init(dp, d)
+    for layer in _hk_layers(m)[2:]:
+        _hk_fill(dp, into, layer)
+    return _hk_tour(dp, d, into)
+
+
+def tsp_held_karp_parallel(
+    dist: list[list[float]], workers: int | None = None, value_type: str = "d"
+) -> tuple[float, list[int]]:
+    """
+    Multi-process Bellman-Held-Karp over a DP table in shared memory.
+
+    Same layer-by-popcount scheme as tsp_held_karp_numpy. The table lives in
+    a multiprocessing.shared_memory block mapped by every worker; each
+    layer is split into one chunk per worker and the pool is drained before
+    the next layer starts. Chunks write disjoint rows and only read the
+    previous layer, so no locking is needed. Small layers stay in the
+    calling process, where dispatch would cost more than the work.
+
+    Args:
+        dist: Distance matrix where dist[i][j] is distance from city i to j
+        workers: Number of processes (default: all cores)
+        value_type: "d" (float64) or "f" (float32, half the memory)
+
+    Returns:
+        (min_cost, optimal_path) where path starts and ends at city 0,
+        identical to tsp_held_karp
+
+    Raises:
+        RuntimeError: If NumPy is not installed
+    """
+    if np is None:
+        raise RuntimeError("NumPy is required for the parallel Held-Karp engine")
+    if len(dist) < PARALLEL_HK_MIN_CITIES:
+        return tsp_held_karp_numpy(dist, value_type)
+
+    m: int = len(dist) - 1
+    workers = workers or os.cpu_count() or 1
+    d, into = _hk_matrices(dist, value_type)
+    shape: tuple[int, int] = (1 << m, m)
+    shm = shared_memory.SharedMemory(
+        create=True, size=shape[0] * shape[1] * d.dtype.itemsize
+    )
+    dp = np.ndarray(shape, dtype=d.dtype, buffer=shm.buf)
+    try:
+        _hk_init(dp, d)
+        with ProcessPoolExecutor(
+            max_workers=workers,
+            initializer=_hk_attach,
+            initargs=(shm.name, shape, d.dtype.str, into),
+        ) as pool:
+            for layer in _hk_layers(m)[2:]:
+                if len(layer) < _PARALLEL_HK_MIN_LAYER:
+                    _hk_fill(dp, into, layer)
+                else:
+                    # Wait for the whole layer: the next one reads all of it
+                    list(pool.map(_hk_fill_shared, np.array_split(layer, workers)))
+        return _hk_tour(dp, d, into)
+    finally:
+        del dp  # Views must go before the block can be closed
+        shm.close()
+        shm.unlink()
+
+
+# Below these sizes the parallel engine falls back to, or stays in, one process
+PARALLEL_HK_MIN_CITIES: int = 14
+_PARALLEL_HK_MIN_LAYER: int = 4096
+
+# Worker-side view of the shared DP table, set by _hk_attach
+_hk_shared: dict[str, Any] = {}
+
+
+def _hk_attach(name: str, shape: tuple[int, int], dtype: str, into: Any) -> None:
+    """Pool initializer: map the shared DP table once per worker."""
+    shm = shared_memory.SharedMemory(name=name)
+    _hk_shared["shm"] = shm  # Keep the mapping alive for the worker's life
+    _hk_shared["dp"] = np.ndarray(shape, dtype=dtype, buffer=shm.buf)
+    _hk_shared["into"] = into
+
+
+def _hk_fill_shared(subsets: Any) -> None:
+    """Fill one chunk of a layer in the shared table (worker side)."""
+    _hk_fill(_hk_shared["dp"], _hk_shared["into"], subsets)
+
+
+def _hk_matrices(dist: list[list[float]], value_type: str) -> tuple[Any, Any]:
+    """Distance array and into[j][i] = cost from city i + 1 to city j + 1."""
+    d = np.array(dist, dtype=np.float32 if value_type == "f" else np.float64)
+    return d, np.ascontiguousarray(d[1:, 1:].T)
+
+
+def _hk_init(dp: Any, d: Any) -> None:
+    """Set every entry to inf except the single-city base cases."""
+    m: int = dp.shape[1]
+    dp.fill(np.inf)
+    dp[1 << np.arange(m), np.arange(m)] = d[0, 1:]
+
+
+def _hk_layers(m: int) -> list[Any]:
+    """Masks over m cities grouped by popcount: layers[k] has k cities."""
+    masks = np.arange(1 << m, dtype=np.int64)
+    popcount = np.zeros(1 << m, dtype=np.int8)
+    for j in range(m):
+        popcount += (masks >> j) & 1
+    return [masks[popcount == size] for size in range(m + 1)]
+
+
+def _hk_fill(dp: Any, into: Any, subsets: Any) -> None:
+    """Fill DP rows of subsets, whose predecessors are all complete."""
+    for j in range(dp.shape[1]):
+        ending = subsets[(subsets >> j) & 1 == 1]
+        # Cities outside a predecessor hold inf, so they never win the min
+        dp[ending, j] = (dp[ending ^ (1 << j)] + into[j]).min(axis=1)
+
 
-    while curr != 0:
-        path.append(curr)
-        prev = parent[mask][curr]
-        mask ^= 1 << curr
-        curr = prev
+def _hk_tour(dp: Any, d: Any, into: Any) -> tuple[float, list[int]]:
+    """Close the tour back to city 0 and walk the table back to a path."""
+    full: int = dp.shape[0] - 1
+    totals = dp[full] + d[1:, 0]
+    best_last: int = int(np.argmin(totals))
+    best_cost: float = float(totals[best_last])
+    if best_cost == float("inf"):
+        return float("inf"), []
+
+    # Walk back, picking the predecessor that achieves each stored cost
+    path: list[int] = [best_last + 1]
+    mask: int = full
+    j: int = best_last
+    while mask & (mask - 1):
+        mask ^= 1 << j
+        j = int(np.argmin(dp[mask] + into[j]))
+        path.append(j + 1)
 
     path.reverse()
     return best_cost, [0] + path + [0]
 
 
+def tsp_held_karp_disk(
+    dist: list[list[float]],
+    workdir: str,
+    value_type: str = "d",
+    block_size: int = 1 << 15,
+    progress: Callable[[int, int], None] | None = None,
+) -> tuple[float, list[int]]:
+    """
+    Out-of-core Bellman-Held-Karp with one memory-mapped file per layer.
+    Complexity: O(n² × 2ⁿ) time, two layers of values in RAM at most
+
+    Layer k holds the subsets of cities 1..n-1 with k cities, in colex rank
+    order (combinatorial number system), and k values per subset: one per
+    end city in the subset, in ascending city order. A layer is written
+    sequentially in blocks while the previous one is read through its
+    memory map; it is then dropped, so disk use is about two value layers
+    plus the int8 parent layers kept for reconstruction.
+
+    Each finished layer is recorded in workdir/meta.json. Calling again
+    with the same matrix and workdir resumes after the last finished layer.
+    All files are removed once the tour is returned.
+
+    Args:
+        dist: Distance matrix where dist[i][j] is distance from city i to j
+        workdir: Directory for layer files and the checkpoint
+        value_type: "d" (float64) or "f" (float32, half the disk and I/O)
+        block_size: Subsets per vectorized block (bounds RAM per step)
+        progress: Called as progress(layer, n - 1) after each layer
+
+    Returns:
+        (min_cost, optimal_path) where path starts and ends at city 0,
+        identical to tsp_held_karp
+
+    Raises:
+        RuntimeError: If NumPy is not installed
+        ValueError: If workdir holds a checkpoint for another instance
+    """
+    if np is None:
+        raise RuntimeError("NumPy is required for the disk-backed Held-Karp engine")
+    n: int = len(dist)
+    if n == 0:
+        return 0.0, []
+    if n == 1:
+        return 0.0, [0, 0]
+
+    m: int = n - 1
+    d, _ = _hk_matrices(dist, value_type)
+    binom = _hk_binomials(m)
+    os.makedirs(workdir, exist_ok=True)
+    meta_path: str = os.path.join(workdir, "meta.json")
+    digest: str = hashlib.sha256(d.tobytes()).hexdigest()
+
+    done: int = 0
+    if os.path.exists(meta_path):
+        with open(meta_path) as f:
+            meta: dict[str, Any] = json.load(f)
+        if meta["digest"] != digest:
+            raise ValueError(f"{workdir} holds a checkpoint for another instance")
+        done = meta["layers"]
+
+    if done == 0:
+        # Layer 1: the rank of {b} is b, the only predecessor is city 0
+        values = _hk_layer(workdir, "values", 1, m, "w+", binom, d.dtype)
+        parents = _hk_layer(workdir, "parents", 1, m, "w+", binom, np.int8)
+        values[:, 0] = d[0, 1:]
+        parents[:] = -1
+        _hk_checkpoint(meta_path, digest, values, parents, 1)
+        done = 1
+        if progress is not None:
+            progress(1, m)
+
+    into = d[1:, 1:]  # into[i][j] = cost from city i + 1 to city j + 1
+    for k in range(done + 1, m + 1):
+        prev = _hk_layer(workdir, "values", k - 1, m, "r", binom, d.dtype)
+        values = _hk_layer(workdir, "values", k, m, "w+", binom, d.dtype)
+        parents = _hk_layer(workdir, "parents", k, m, "w+", binom, np.int8)
+        for start in range(0, len(values), block_size):
+            stop: int = min(start + block_size, len(values))
+            bits = _hk_unrank(np.arange(start, stop, dtype=np.int64), k, binom)
+            _hk_fill_block(
+                prev, into, bits, binom, values[start:stop], parents[start:stop]
+            )
+        del prev
+        _hk_checkpoint(meta_path, digest, values, parents, k)
+        os.remove(_hk_layer_path(workdir, "values", k - 1))
+        if progress is not None:
+            progress(k, m)
+
+    # Close the tour back to city 0: the last layer is the single full set
+    last = _hk_layer(workdir, "values", m, m, "r", binom, d.dtype)
+    totals = last[0] + d[1:, 0]
+    del last
+    best_last: int = int(np.argmin(totals))
+    best_cost: float = float(totals[best_last])
+
+    path: list[int] = []
+    if best_cost != float("inf"):
+        # Walk back through the parent layers, one city per layer
+        path.append(best_last + 1)
+        mask: int = (1 << m) - 1
+        j: int = best_last
+        for k in range(m, 1, -1):
+            parents = _hk_layer(workdir, "parents", k, m, "r", binom, np.int8)
+            position: int = bin(mask & ((1 << j) - 1)).count("1")
+            i: int = int(parents[_hk_rank(mask, binom), position])
+            del parents
+            mask ^= 1 << j
+            j = i
+            path.append(j + 1)
+        path.reverse()
+
+    for k in range(1, m + 1):
+        os.remove(_hk_layer_path(workdir, "parents", k))
+    os.remove(_hk_layer_path(workdir, "values", m))
+    os.remove(meta_path)
+    if best_cost == float("inf"):
+        return float("inf"), []
+    return best_cost, [0] + path + [0]
+
+
+def _hk_binomials(m: int) -> Any:
+    """binom[b, i] = C(b, i) for 0 <= b <= m, 0 <= i <= m + 1."""
+    binom = np.zeros((m + 1, m + 2), dtype=np.int64)
+    binom[:, 0] = 1
+    for b in range(1, m + 1):
+        binom[b, 1:] = binom[b - 1, 1:] + binom[b - 1, :-1]
+    return binom
+
+
+def _hk_rank(mask: int, binom: Any) -> int:
+    """Colex rank of a subset among those of the same size."""
+    rank: int = 0
+    i: int = 0
+    while mask:
+        b: int = (mask & -mask).bit_length() - 1
+        mask &= mask - 1
+        i += 1
+        rank += int(binom[b, i])
+    return rank
+
+
+def _hk_unrank(ranks: Any, k: int, binom: Any) -> Any:
+    """Cities of the subsets with the given colex ranks, ascending per row."""
+    bits = np.empty((len(ranks), k), dtype=np.int64)
+    rest = ranks.copy()
+    for i in range(k, 0, -1):
+        # Largest b with C(b, i) <= rest: column i is non-decreasing in b
+        b = np.searchsorted(binom[:, i], rest, side="right") - 1
+        bits[:, i - 1] = b
+        rest -= binom[b, i]
+    return bits
+
+
+def _hk_fill_block(
+    prev: Any, into: Any, bits: Any, binom: Any, values: Any, parents: Any
+) -> None:
+    """Fill a block of layer k (cities in bits) from layer k - 1."""
+    k: int = bits.shape[1]
+    rows = np.arange(len(bits))
+    # Rank of the subset without its p-th city: cities below p keep their
+    # term C(b, i + 1), cities above it move down one slot to C(b, i)
+    below = np.cumsum(binom[bits, np.arange(1, k + 1)], axis=1)
+    above = np.cumsum(binom[bits, np.arange(k)][:, ::-1], axis=1)[:, ::-1]
+    for p in range(k):
+        prev_rank = (below[:, p - 1] if p else 0) + (
+            above[:, p + 1] if p + 1 < k else 0
+        )
+        others = np.delete(bits, p, axis=1)
+        candidates = prev[prev_rank] + into[others, bits[:, p : p + 1]]
+        best = np.argmin(candidates, axis=1)
+        values[:, p] = candidates[rows, best]
+        parents[:, p] = others[rows, best]
+
+
+def _hk_layer_path(workdir: str, kind: str, k: int) -> str:
+    return os.path.join(workdir, f"{kind}_{k:02d}.bin")
+
+
+def _hk_layer(
+    workdir: str, kind: str, k: int, m: int, mode: str, binom: Any, dtype: Any
+) -> Any:
+    """Memory-map the values or parents of layer k, shape (C(m, k), k)."""
+    return np.memmap(
+        _hk_layer_path(workdir, kind, k),
+        dtype=dtype,
+        mode=mode,
+        shape=(int(binom[m, k]), k),
+    )
+
+
+def _hk_checkpoint(
+    meta_path: str, digest: str, values: Any, parents: Any, layers: int
+) -> None:
+    """Flush a finished layer, then record it atomically."""
+    values.flush()
+    parents.flush()
+    tmp_path: str = meta_path + ".tmp"
+    with open(tmp_path, "w") as f:
+        json.dump({"digest": digest, "layers": layers}, f)
+    os.replace(tmp_path, meta_path)
+
+
+def _held_karp_disk_temp(dist: list[list[float]]) -> tuple[float, list[int]]:
+    """Disk-backed Held-Karp in a throwaway directory (GUI engine)."""
+    with tempfile.TemporaryDirectory(prefix="tsp_held_karp_") as workdir:
+        return tsp_held_karp_disk(dist, workdir)
+
+
+# Held-Karp engines selectable from the GUI (NumPy only when installed)
+HELD_KARP_ENGINES: dict[str, Callable[[list[list[float]]], tuple[float, list[int]]]] = {
+    "Pure Python": tsp_held_karp,
+}
+if np is not None:
+    HELD_KARP_ENGINES["NumPy"] = tsp_held_karp_numpy
+    HELD_KARP_ENGINES["NumPy, all cores"] = tsp_held_karp_parallel
+    HELD_KARP_ENGINES["NumPy, disk-backed"] = _held_karp_disk_temp
+
+
+def tsp_branch_and_bound(
+    dist: list[list[float]],
+    time_limit: float | None = None,
+    max_nodes: int | None = None,
+    stats: dict[str, Any] | None = None,
+) -> tuple[float, list[int]]:
+    """
+    Exact TSP by best-first branch-and-bound, for symmetric matrices.
+
+    Each node forces some edges into the tour and excludes others. Its lower
+    bound is the Held-Karp bound: the minimum 1-tree (spanning tree on cities
+    1..n-1 plus the two cheapest edges at city 0) under city penalties pi,
+    raised by subgradient ascent. Children start from their parent's pi, so
+    they only need a few ascent steps. A node whose 1-tree is a tour is
+    solved; otherwise the tree edges at a city of degree > 2 are branched on
+    (Volgenant-Jonker). The upper bound starts from the tsp_local_search
+    tour. Nodes that cannot beat it are pruned.
+
+    Most random instances up to 80 cities solve in seconds, but the search
+    tree can grow exponentially: some 80-city instances take minutes. Set
+    time_limit or max_nodes to bound the run; the best tour found so far is
+    then returned, and stats["proven"] is False.
+
+    Args:
+        dist: Symmetric distance matrix, inf for missing edges
+        time_limit: Wall-clock seconds before giving up on the proof
+            (default: no limit)
+        max_nodes: Number of branched nodes before giving up (default: no limit)
+        stats: Optional dict filled with "proven" (whether the returned tour
+            is known to be optimal) and "nodes" (number of branched nodes)
+
+    Returns:
+        (min_cost, path) where path starts and ends at city 0
+
+    Raises:
+        ValueError: If the matrix is not symmetric
+    """
+    n: int = len(dist)
+    if stats is not None:
+        stats.update(proven=True, nodes=0)
+    if n == 0:
+        return 0.0, []
+    if n == 1:
+        return 0.0, [0, 0]
+    if not _is_symmetric(dist):
+        raise ValueError("Branch-and-bound requires a symmetric distance matrix")
+    if n <= 3:
+        return tsp_held_karp(dist)
+
+    deadline: float = (
+        float("inf") if time_limit is None else time.perf_counter() + time_limit
+    )
+    inf: float = float("inf")
+    # With integer costs a bound of 41.2 already proves a 42 tour optimal
+    integral: bool = all(
+        x == inf or float(x).is_integer() for row in dist for x in row
+    )
+
+    best_cost, best_tour = tsp_local_search(dist)
+
+    def dominated(bound: float) -> bool:
+        if integral:
+            return math.ceil(bound - 1e-6) >= best_cost
+        return bound >= best_cost - 1e-9
+
+    def evaluate(
+        forced: frozenset[tuple[int, int]],
+        excluded: frozenset[tuple[int, int]],
+        pi: list[float],
+        iterations: int,
+    ) -> tuple[float, list[float], list[tuple[int, int]], list[int]] | None:
+        """Subgradient ascent on one node: best (bound, pi, tree, degrees)."""
+        cost: list[list[float]] = [list(row) for row in dist]
+        for i, j in excluded:
+            cost[i][j] = cost[j][i] = inf
+        for i, j in forced:
+            cost[i][j] = cost[j][i] = dist[i][j] - _BB_FORCED
+        best: tuple[float, list[float], list[tuple[int, int]], list[int]] | None
+        best = None
+        step: float = 2.0
+        stall: int = 0
+        for _ in range(iterations):
+            tree = _one_tree(cost, pi)
+            if tree is None:
+                return None
+            edges, degree = tree
+            bound: float = sum(dist[i][j] for i, j in edges) + sum(
+                p * (d - 2) for p, d in zip(pi, degree)
+            )
+            if best is None or bound > best[0] + 1e-9:
+                best = (bound, pi, edges, degree)
+                stall = 0
+            else:
+                stall += 1
+                if stall >= _BB_STALL:
+                    step /= 2
+                    stall = 0
+            if dominated(bound) or all(d == 2 for d in degree):
+                return bound, pi, edges, degree
+            # Push pi up at cities of degree > 2, down at leaves
+            norm: int = sum((d - 2) ** 2 for d in degree)
+            target: float = min(best_cost, bound + abs(bound) * _BB_TARGET_GAP + 1)
+            t: float = step * (target - bound) / norm
+            pi = [p + t * (d - 2) for p, d in zip(pi, degree)]
+        return best
+
+    root = evaluate(frozenset(), frozenset(), [0.0] * n, _BB_ROOT_ITERATIONS * n)
+    if root is None:
+        return inf, []
+    counter: int = 0
+    branched: int = 0
+    proven: bool = True
+    heap: list[tuple[Any, ...]] = [(root[0], counter, frozenset(), frozenset()) + root]
+    while heap:
+        bound, _, forced, excluded, _, pi, edges, degree = heapq.heappop(heap)
+        # Best-first: every remaining node has a bound at least as high
+        if dominated(bound):
+            break
+        if (max_nodes is not None and branched >= max_nodes) or (
+            time.perf_counter() > deadline
+        ):
+            proven = False
+            break
+        if all(d == 2 for d in degree):
+            best_cost, best_tour = bound, _tree_tour(edges, n)
+            continue
+
+        branched += 1
+        city: int = max(range(n), key=degree.__getitem__)
+        pinned: int = sum(1 for e in forced if city in e)
+        free: list[tuple[int, int]] = [
+            e for e in edges if city in e and e not in forced
+        ]
+        if pinned == 0:
+            branches = [
+                ((), (free[0],)),
+                ((free[0],), (free[1],)),
+                ((free[0], free[1]), ()),
+            ]
+        else:
+            branches = [((), (free[0],)), ((free[0],), ())]
+
+        for add_in, add_out in branches:
+            constrained = _bb_constrain(n, forced, excluded, add_in, add_out)
+            if constrained is None:
+                continue
+            child = evaluate(*constrained, pi, _BB_CHILD_ITERATIONS)
+            if child is None or dominated(child[0]):
+                continue
+            counter += 1
+            heapq.heappush(heap, (child[0], counter) + constrained + child)
+
+    if stats is not None:
+        stats.update(proven=proven, nodes=branched)
+    if best_cost == inf:
+        return inf, []
+    return best_cost, best_tour
+
+
+# Weight offset that keeps forced edges in every 1-tree
+_BB_FORCED: float = 1e9
+# Subgradient steps: per city at the root, per node below it; the step size
+# halves after _BB_STALL steps without a better bound
+_BB_ROOT_ITERATIONS: int = 5
+_BB_CHILD_ITERATIONS: int = 50
+_BB_STALL: int = 10
+_BB_TARGET_GAP: float = 0.01
+
+
+def _one_tree(
+    cost: list[list[float]], pi: list[float]
+) -> tuple[list[tuple[int, int]], list[int]] | None:
+    """Minimum 1-tree under penalties pi: (edges as (i, j) with i < j, degrees)."""
+    n: int = len(cost)
+    inf: float = float("inf")
+    key: list[float] = [inf] * n
+    link: list[int] = [-1] * n
+    rest: list[int] = list(range(2, n))
+    edges: list[tuple[int, int]] = []
+    degree: list[int] = [0] * n
+
+    # Prim on cities 1..n-1
+    u: int = 1
+    while rest:
+        row: list[float] = cost[u]
+        offset: float = pi[u]
+        for v in rest:
+            w: float = row[v] + offset + pi[v]
+            if w < key[v]:
+                key[v] = w
+                link[v] = u
+        u = min(rest, key=key.__getitem__)
+        if key[u] == inf:
+            return None
+        rest.remove(u)
+        edges.append((min(u, link[u]), max(u, link[u])))
+        degree[u] += 1
+        degree[link[u]] += 1
+
+    # Two cheapest edges at city 0
+    first, second = heapq.nsmallest(
+        2, range(1, n), key=lambda j: cost[0][j] + pi[0] + pi[j]
+    )
+    if cost[0][second] == inf:
+        return None
+    edges += [(0, first), (0, second)]
+    degree[0] = 2
+    degree[first] += 1
+    degree[second] += 1
+    return edges, degree
+
+
+def _bb_constrain(
+    n: int,
+    forced: frozenset[tuple[int, int]],
+    excluded: frozenset[tuple[int, int]],
+    add_in: tuple[tuple[int, int], ...],
+    add_out: tuple[tuple[int, int], ...],
+) -> tuple[frozenset[tuple[int, int]], frozenset[tuple[int, int]]] | None:
+    """Add edge constraints and their consequences; None if infeasible."""
+    if any(e in forced for e in add_out) or any(e in excluded for e in add_in):
+        return None
+    forced_set: set[tuple[int, int]] = set(forced) | set(add_in)
+    excluded_set: set[tuple[int, int]] = set(excluded) | set(add_out)
+
+    incident: list[list[tuple[int, int]]] = [[] for _ in range(n)]
+    for e in forced_set:
+        incident[e[0]].append(e)
+        incident[e[1]].append(e)
+    for city in range(n):
+        if len(incident[city]) > 2:
+            return None
+        if len(incident[city]) == 2:
+            # Saturated: every other edge at this city is out
+            excluded_set.update(
+                (min(city, v), max(city, v))
+                for v in range(n)
+                if v != city and (min(city, v), max(city, v)) not in forced_set
+            )
+
+    # Forced edges form paths (and cycles, which must be a whole tour).
+    # Joining the two ends of a path early would close a subtour.
+    seen: list[bool] = [False] * n
+
+    def walk(start: int) -> tuple[int, int]:
+        """Follow forced edges from start: (city where it stops, edges walked)."""
+        prev, city, length = -1, start, 0
+        while True:
+            seen[city] = True
+            ahead = [e[0] + e[1] - city for e in incident[city]]
+            ahead = [v for v in ahead if v != prev]
+            if not ahead:
+                return city, length  # Other end of a path
+            prev, city, length = city, ahead[0], length + 1
+            if city == start:
+                return city, length  # Back around a cycle
+
+    for start in range(n):
+        if not seen[start] and len(incident[start]) == 1:
+            end, length = walk(start)
+            if 1 < length < n - 1:
+                excluded_set.add((min(start, end), max(start, end)))
+    for start in range(n):
+        if not seen[start] and incident[start] and walk(start)[1] < n:
+            return None
+
+    if forced_set & excluded_set:
+        return None
+    for city in range(n):
+        allowed = sum(
+            1
+            for v in range(n)
+            if v != city and (min(city, v), max(city, v)) not in excluded_set
+        )
+        if allowed < 2:
+            return None
+    return frozenset(forced_set), frozenset(excluded_set)
+
+
+def _tree_tour(edges: list[tuple[int, int]], n: int) -> list[int]:
+    """Walk a 1-tree whose cities all have degree 2: it is a tour."""
+    adjacent: list[list[int]] = [[] for _ in range(n)]
+    for i, j in edges:
+        adjacent[i].append(j)
+        adjacent[j].append(i)
+    tour: list[int] = [0]
+    prev, city = 0, adjacent[0][0]
+    while city != 0:
+        tour.append(city)
+        prev, city = city, (
+            adjacent[city][0] if adjacent[city][1] == prev else adjacent[city][1]
+        )
+    return tour + [0]
+
+
+def tsp_local_search(
+    dist: list[list[float]],
+    time_limit: float | None = None,
+    neighbors: int = 10,
+    construction: str = "greedy",
+) -> tuple[float, list[int]]:
+    """
+    Heuristic TSP for large symmetric instances: construction + 2-opt/Or-opt.
+    Complexity: O(n²) for the candidate lists, then roughly O(n) per sweep
+
+    A start tour is built by greedy edge matching or nearest neighbour, then
+    improved with 2-opt moves and Or-opt moves (a segment of 1 to 3 cities
+    moved elsewhere, possibly reversed). Moves only consider the k nearest
+    cities of each endpoint. Don't-look bits keep a queue of cities whose
+    neighbourhood changed, and the tour lives in an array with a position
+    index, so a move costs one or a few segment reversals. Since the queue
+    only re-examines endpoints of changed edges, full sweeps over every city
+    repeat until none finds a move: unless time_limit stops it, the result
+    is 2-opt/Or-opt optimal over the candidate lists (not a proven optimum).
+
+    Args:
+        dist: Symmetric distance matrix (inf for missing edges) or an
+            EuclideanInstance
+        time_limit: Seconds allowed for improvement (default: until no move
+            improves); construction always completes
+        neighbors: Size of each city's candidate list
+        construction: A key of TOUR_CONSTRUCTIONS ("greedy" or "nearest")
+
+    Returns:
+        (cost, path) where path starts and ends at city 0,
+        or (inf, []) if no finite tour was found
+
+    Raises:
+        ValueError: If the matrix is not symmetric or construction is unknown
+    """
+    n: int = len(dist)
+    if n == 0:
+        return 0.0, []
+    if n == 1:
+        return 0.0, [0, 0]
+    if not _is_symmetric(dist):
+        raise ValueError("Local search requires a symmetric distance matrix")
+    if construction not in TOUR_CONSTRUCTIONS:
+        raise ValueError(f"Unknown tour construction: {construction!r}")
+
+    deadline: float = (
+        float("inf") if time_limit is None else time.perf_counter() + time_limit
+    )
+    candidates: list[list[int]] = _candidate_lists(dist, min(neighbors, n - 1))
+    order: list[int] = TOUR_CONSTRUCTIONS[construction](dist, candidates)
+    return _closed_tour(dist, _improve_tour(dist, order, candidates, deadline))
+
+
+def tsp_lin_kernighan(
+    dist: list[list[float]],
+    time_limit: float = 10.0,
+    neighbors: int | None = None,
+    candidate_set: str | None = None,
+    depth: int = 8,
+    max_kicks: int | None = None,
+    seed: int | None = None,
+) -> tuple[float, list[int]]:
+    """
+    Iterated Lin-Kernighan heuristic for near-optimal tours on large instances.
+
+    Starts like tsp_local_search, but the 2-opt step is replaced by
+    Lin-Kernighan chains: a removed edge (t1, t2) is followed by up to depth
+    sequential exchanges, each adding the edge from t2 to a candidate t3
+    and removing one of t3's tour edges, and the chain is cut back to its
+    most profitable prefix. Or-opt moves (the Or-3opt segment insertions)
+    are kept alongside. Once no move improves, a random double-bridge kick
+    (a 4-opt move that chains cannot undo) reshuffles three nearby
+    segments. The tour is re-optimized around the kick and kept only if it
+    is no longer than the best one. Kicks repeat until the time budget or
+    max_kicks runs out.
+
+    Args:
+        dist: Symmetric distance matrix (inf for missing edges) or an
+            EuclideanInstance
+        time_limit: Wall-clock seconds for the whole run, candidate lists
+            and construction included
+        neighbors: Size of each city's candidate list (default: the
+            CANDIDATE_COUNTS entry for candidate_set)
+        candidate_set: A key of CANDIDATE_SETS ("alpha" or "nearest");
+            default "alpha" for matrices, "nearest" (KD-tree) for an
+            EuclideanInstance, where alpha-nearness would be O(n²)
+        depth: Maximum number of exchanges in one Lin-Kernighan chain
+        max_kicks: Stop after this many kicks (default: only time_limit)
+        seed: Seed for the kick positions, for reproducible runs
+
+    Returns:
+        (cost, path) where path starts and ends at city 0,
+        or (inf, []) if no finite tour was found
+
+    Raises:
+        ValueError: If the matrix is not symmetric or candidate_set is unknown
+    """
+    deadline: float = time.perf_counter() + time_limit
+    n: int = len(dist)
+    if n == 0:
+        return 0.0, []
+    if n == 1:
+        return 0.0, [0, 0]
+    if not _is_symmetric(dist):
+        raise ValueError("Lin-Kernighan requires a symmetric distance matrix")
+    if candidate_set is None:
+        coordinates: bool = isinstance(dist, EuclideanInstance)
+        candidate_set = "nearest" if coordinates else "alpha"
+    if candidate_set not in CANDIDATE_SETS:
+        raise ValueError(f"Unknown candidate set: {candidate_set!r}")
+    if neighbors is None:
+        neighbors = CANDIDATE_COUNTS[candidate_set]
+
+    candidates: list[list[int]] = CANDIDATE_SETS[candidate_set](
+        dist, min(neighbors, n - 1)
+    )
+    order: list[int] = _greedy_tour(dist, candidates)
+    order = _improve_tour(
+        dist,
+        order,
+        candidates,
+        deadline,
+        depth=depth,
+        rng=random.Random(seed),
+        max_kicks=max_kicks,
+    )
+    return _closed_tour(dist, order)
+
+
+def _closed_tour(dist: list[list[float]], order: list[int]) -> tuple[float, list[int]]:
+    """(cost, path) of a city order, rotated to start and end at city 0."""
+    k: int = order.index(0)
+    path: list[int] = order[k:] + order[:k] + [0]
+    cost: float = sum(dist[a][b] for a, b in zip(path, path[1:]))
+    return (cost, path) if cost < float("inf") else (float("inf"), [])
+
+
+def _is_symmetric(dist: list[list[float]]) -> bool:
+    """Whether dist[i][j] == dist[j][i] everywhere; free for coordinates."""
+    if isinstance(dist, EuclideanInstance):
+        return True
+    n: int = len(dist)
+    return all(dist[i][j] == dist[j][i] for i in range(n) for j in range(i))
+
+
+def _candidate_lists(dist: list[list[float]], k: int) -> list[list[int]]:
+    """The k nearest other cities of each city, nearest first."""
+    if isinstance(dist, EuclideanInstance):
+        return dist.neighbors(k)
+    n: int = len(dist)
+    lists: list[list[int]] = []
+    for i, row in enumerate(dist):
+        nearest: list[int] = heapq.nsmallest(k + 1, range(n), key=row.__getitem__)
+        lists.append([c for c in nearest if c != i][:k])
+    return lists
+
+
+def _alpha_candidates(dist: list[list[float]], k: int) -> list[list[int]]:
+    """
+    The k alpha-nearest cities of each city (Helsgaun's alpha-nearness).
+
+    alpha(i, j) is how much the minimum spanning tree grows when it is
+    forced to contain edge (i, j): its cost minus the largest edge on the
+    tree path from i to j. Edges of optimal tours have small alpha far more
+    often than they are among the plain nearest neighbours. The tree path
+    maxima (beta) for one i are filled in Prim insertion order, where every
+    city's tree parent comes first. O(n²) time, O(n) extra memory.
+    """
+    n: int = len(dist)
+    inf: float = float("inf")
+    key: list[float] = list(dist[0])
+    dad: list[int] = [0] * n
+    order: list[int] = [0]
+    rest: set[int] = set(range(1, n))
+    while rest:
+        j: int = min(rest, key=key.__getitem__)
+        rest.remove(j)
+        order.append(j)
+        row: list[float] = dist[j]
+        for c in rest:
+            if row[c] < key[c]:
+                key[c], dad[c] = row[c], j
+
+    lists: list[list[int]] = []
+    mark: list[int] = [-1] * n
+    for i, row in enumerate(dist):
+        beta: list[float] = [0.0] * n
+        beta[i] = -inf
+        mark[i] = i
+        j = i
+        while j:  # Up to the root: these cities are not below their parent
+            beta[dad[j]] = max(beta[j], key[j])
+            j = dad[j]
+            mark[j] = i
+        for j in order:
+            if mark[j] != i:
+                parent: float = beta[dad[j]]
+                beta[j] = parent if parent > key[j] else key[j]
+        alpha: list[float] = [c - b for c, b in zip(row, beta)]
+        nearest: list[int] = heapq.nsmallest(k + 1, range(n), key=alpha.__getitem__)
+        nearest.sort(key=lambda j: (alpha[j], row[j]))
+        lists.append([c for c in nearest if c != i][:k])
+    return lists
+
+
+def _greedy_tour(dist: list[list[float]], candidates: list[list[int]]) -> list[int]:
+    """Greedy edge matching over candidate edges, repeated on fragment ends."""
+    n: int = len(dist)
+    links: list[list[int]] = [[] for _ in range(n)]
+    root: list[int] = list(range(n))  # Union-find over fragments
+    pieces: int = n
+
+    def find(x: int) -> int:
+        while root[x] != x:
+            root[x] = root[root[x]]
+            x = root[x]
+        return x
+
+    def match(edges: set[tuple[float, int, int]]) -> None:
+        nonlocal pieces
+        for _, i, j in sorted(edges):
+            if len(links[i]) < 2 and len(links[j]) < 2:
+                ri, rj = find(i), find(j)
+                if ri != rj:
+                    root[ri] = rj
+                    links[i].append(j)
+                    links[j].append(i)
+                    pieces -= 1
+
+    match({(dist[i][j], min(i, j), max(i, j)) for i in range(n) for j in candidates[i]})
+    # No cycle was closed, so the fragments are paths: match their free ends
+    # among themselves until one path is left. Each round links at least the
+    # closest pair of ends from different fragments.
+    while pieces > 1:
+        ends: list[int] = [c for c in range(n) if len(links[c]) < 2]
+        sub: list[list[float]] = _restrict(dist, ends)
+        near: list[list[int]] = _candidate_lists(sub, min(8, len(ends) - 1))
+        match(
+            {
+                (sub[a][b], min(ends[a], ends[b]), max(ends[a], ends[b]))
+                for a in range(len(ends))
+                for b in near[a]
+            }
+        )
+
+    order: list[int] = [next(c for c in range(n) if len(links[c]) < 2)]
+    prev: int = -1
+    while len(order) < n:
+        city: int = next(c for c in links[order[-1]] if c != prev)
+        prev = order[-1]
+        order.append(city)
+    return order
+
+
+def _restrict(dist: list[list[float]], cities: list[int]) -> list[list[float]]:
+    """The distances among cities only, renumbered 0..len(cities)-1."""
+    if isinstance(dist, EuclideanInstance):
+        return EuclideanInstance(
+            [dist.xs[c] for c in cities], [dist.ys[c] for c in cities], dist.metric
+        )
+    return [[dist[i][j] for j in cities] for i in cities]
+
+
+def _nearest_neighbor_tour(
+    dist: list[list[float]], candidates: list[list[int]]
+) -> list[int]:
+    """Nearest-neighbour tour from city 0, scanning all cities only as a fallback."""
+    n: int = len(dist)
+    order: list[int] = [0]
+    rest: set[int] = set(range(1, n))
+    while rest:
+        last: int = order[-1]
+        city: int = next((c for c in candidates[last] if c in rest), -1)
+        if city < 0:
+            city = min(rest, key=dist[last].__getitem__)
+        order.append(city)
+        rest.remove(city)
+    return order
+
+
+def _improve_tour(
+    dist: list[list[float]],
+    order: list[int],
+    candidates: list[list[int]],
+    deadline: float,
+    depth: int = 0,
+    rng: random.Random | None = None,
+    max_kicks: int | None = None,
+) -> list[int]:
+    """
+    Improve a tour (city order, not closed) until no move helps.
+
+    Uses 2-opt moves, or Lin-Kernighan chains of up to depth exchanges when
+    depth > 0, plus Or-opt moves. Without an rng, full sweeps confirm that
+    no move is left; with one, the local optimum is instead kicked by double
+    bridges, keeping each result that is no longer.
+    """
+    n: int = len(order)
+    eps: float = 1e-9
+    gained: float = 0.0
+    tour = array("i", order)
+    pos = array("i", bytes(4 * n))
+    for i, city in enumerate(tour):
+        pos[city] = i
+
+    def succ(city: int) -> int:
+        i: int = pos[city] + 1
+        return tour[i if i < n else 0]
+
+    def pred(city: int) -> int:
+        return tour[pos[city] - 1]
+
+    def move(a: int, b: int, c: int, d: int) -> None:
+        # Edges (a, b), (c, d) become (a, c), (b, d); b follows a, d follows c
+        i, j = pos[b], pos[c]
+        if succ(a) != b:  # The pair is oriented against the array
+            i, j = j, i
+        size: int = (j - i) % n + 1
+        if 2 * size > n:  # Reversing the rest gives the same cycle
+            i, j, size = (j + 1) % n, (i - 1) % n, n - size
+        if i <= j:
+            tour[i : j + 1] = tour[i : j + 1][::-1]
+            for k in range(i, j + 1):
+                pos[tour[k]] = k
+            return
+        for _ in range(size // 2):
+            x, y = tour[i], tour[j]
+            tour[i], tour[j] = y, x
+            pos[y], pos[x] = i, j
+            i = i + 1 if i + 1 < n else 0
+            j = j - 1 if j else n - 1
+
+    def two_opt(a: int) -> tuple[int, ...]:
+        nonlocal gained
+        row: list[float] = dist[a]
+        for step in (succ, pred):
+            b: int = step(a)
+            dab: float = row[b]
+            for c in candidates[a]:
+                gain: float = dab - row[c]
+                if not gain > eps:
+                    break
+                d: int = step(c)
+                if c == b or d == a:
+                    continue
+                gain += dist[c][d] - dist[b][d]
+                if gain > eps:
+                    gained += gain
+                    move(a, b, c, d)
+                    return a, b, c, d
+        return ()
+
+    def edge(a: int, b: int) -> tuple[int, int]:
+        return (a, b) if a < b else (b, a)
+
+    def exchanges(
+        t1: int,
+        t2: int,
+        gain: float,
+        removed: set[tuple[int, int]],
+        added: set[tuple[int, int]],
+    ) -> list[tuple[float, int, int]]:
+        # Next LK exchanges from t2 as (gain after it, t3, t4), best first
+        after = succ if succ(t2) == t1 else pred  # Walking t2 -> t1
+        row: list[float] = dist[t2]
+        options: list[tuple[float, int, int]] = []
+        for t3 in candidates[t2]:
+            partial: float = gain - row[t3]
+            if not partial > eps:
+                break
+            t4: int = after(t3)
+            if t3 == t1 or t4 == t2:
+                continue
+            if edge(t2, t3) in removed or edge(t3, t4) in added:
+                continue
+            options.append((partial + dist[t3][t4], t3, t4))
+        options.sort(reverse=True)
+        return options
+
+    def lin_kernighan(t1: int) -> tuple[int, ...]:
+        nonlocal gained
+        for step in (succ, pred):
+            t2: int = step(t1)
+            chain: list[tuple[int, int, int, int]] = []
+            gain: float = deepen(t1, t2, dist[t1][t2], {edge(t1, t2)}, set(), chain)
+            if gain:
+                gained += gain
+                return tuple({t for swap in chain for t in swap})
+        return ()
+
+    def deepen(
+        t1: int,
+        head: int,
+        gain: float,
+        removed: set[tuple[int, int]],
+        added: set[tuple[int, int]],
+        chain: list[tuple[int, int, int, int]],
+    ) -> float:
+        # Extend the chain from (t1, head), where gain leaves out that closing
+        # edge. Returns the gain kept in the tour, or 0.0 with it restored.
+        level: int = len(chain)
+        if level == depth:
+            return 0.0
+        breadth: int = _LK_BREADTH[level] if level < len(_LK_BREADTH) else 1
+        for value, t3, t4 in exchanges(t1, head, gain, removed, added)[:breadth]:
+            # (t1, head), (t3, t4) become (head, t3), (t1, t4)
+            move(head, t1, t3, t4)
+            chain.append((head, t3, t1, t4))
+            added.add(edge(head, t3))
+            removed.add(edge(t3, t4))
+            closed: float = value - dist[t1][t4]
+            if closed > eps:
+                # Improving already: go on greedily, then keep the best prefix
+                best, best_length = closed, len(chain)
+                while len(chain) < depth:
+                    options = exchanges(t1, t4, value, removed, added)
+                    if not options:
+                        break
+                    value, t3, t2 = options[0]
+                    move(t4, t1, t3, t2)
+                    chain.append((t4, t3, t1, t2))
+                    added.add(edge(t4, t3))
+                    removed.add(edge(t3, t2))
+                    t4 = t2
+                    closed = value - dist[t1][t4]
+                    if closed > best:
+                        best, best_length = closed, len(chain)
+                while len(chain) > best_length:
+                    move(*chain.pop())
+                return best
+            found: float = deepen(t1, t4, value, removed, added, chain)
+            if found:
+                return found
+            move(*chain.pop())
+            added.discard(edge(head, t3))
+            removed.discard(edge(t3, t4))
+        return 0.0
+
+    def or_opt(a: int) -> tuple[int, ...]:
+        nonlocal gained
+        for size in (1, 2, 3):
+            if n < size + 3:
+                break
+            starts: set[int] = {a, tour[(pos[a] - size + 1) % n]}
+            for s1 in starts:
+                i: int = pos[s1]
+                s2: int = tour[(i + size - 1) % n]
+                p: int = tour[i - 1]
+                nx: int = tour[(i + size) % n]
+                removed: float = dist[p][s1] + dist[s2][nx] - dist[p][nx]
+                if not removed > eps:
+                    continue
+                for end, other in ((s1, s2), (s2, s1)):
+                    row: list[float] = dist[end]
+                    for c in candidates[end]:
+                        if not removed - row[c] > eps:
+                            break
+                        if (pos[c] - i) % n < size:
+                            continue
+                        for e in (succ(c), pred(c)):
+                            if (pos[e] - i) % n < size:
+                                continue
+                            added: float = row[c] + dist[other][e] - dist[c][e]
+                            if not removed - added > eps:
+                                continue
+                            gained += removed - added
+                            # Insert between x and y = succ(x) as three 2-opt
+                            # moves: p x .. nx s2..s1 y, p nx .. x s2..s1 y,
+                            # then flip the segment if s1 must come first
+                            x, y = (c, e) if e == succ(c) else (e, c)
+                            move(p, s1, x, y)
+                            move(p, x, nx, s2)
+                            if size > 1 and (end == s1) == (x == c):
+                                move(x, s2, s1, y)
+                            return p, nx, s1, s2, c, e
+        return ()
+
+    improve: Callable[[int], tuple[int, ...]] = lin_kernighan if depth else two_opt
+    active: bytearray = bytearray(n)
+    checked: int = 0
+    applied: int = 0
+
+    def descend(cities: Iterable[int]) -> bool:
+        # Work through the don't-look queue; False once past the deadline
+        nonlocal checked, applied
+        queue: deque[int] = deque()
+        for city in cities:
+            if not active[city]:
+                active[city] = 1
+                queue.append(city)
+        while queue:
+            checked += 1
+            if checked & 255 == 0 and time.perf_counter() > deadline:
+                return False
+            a: int = queue.popleft()
+            active[a] = 0
+            touched: tuple[int, ...] = improve(a) or or_opt(a)
+            applied += bool(touched)
+            for city in touched:
+                if not active[city]:
+                    active[city] = 1
+                    queue.append(city)
+        return True
+
+    def settle() -> bool:
+        # Only endpoints of changed edges are requeued, so a move between two
+        # untouched cities can be missed: sweep every city until none moves
+        while True:
+            before: int = applied
+            if not descend(tour):
+                return False
+            if applied == before:
+                return True
+
+    # With kicks the time is better spent kicking than confirming the optimum
+    if not (settle() if rng is None else descend(tour)) or rng is None or n < 8:
+        return list(tour)
+
+    best_tour, best_pos = tour[:], pos[:]
+    kicks: int = 0
+    span: int = max(1, min(50, n // 4))  # Segment lengths: keep kicks local
+    while max_kicks is None or kicks < max_kicks:
+        kicks += 1
+        # Double bridge a B C d -> a C B d on two adjacent segments
+        first, second = rng.randint(1, span), rng.randint(1, span)
+        i: int = rng.randrange(n - first - second - 1)
+        j: int = i + 1 + first
+        k: int = j + second
+        a, b, c, d = tour[i], tour[i + 1], tour[j], tour[k]
+        b_end, c_end = tour[j - 1], tour[k - 1]
+        gained = (
+            dist[a][b]
+            + dist[b_end][c]
+            + dist[c_end][d]
+            - dist[a][c]
+            - dist[c_end][b]
+            - dist[b_end][d]
+        )
+        tour[i + 1 : k] = tour[j:k] + tour[i + 1 : j]
+        for p in range(i + 1, k):
+            pos[tour[p]] = p
+        finished: bool = descend((a, b, c, d, b_end, c_end))
+        if gained > -eps:
+            best_tour[:], best_pos[:] = tour, pos
+        else:
+            tour[:], pos[:] = best_tour, best_pos
+        if not finished:
+            break
+    return list(best_tour)
+
+
+# Lin-Kernighan alternatives tried at the first chain levels, then only the best
+_LK_BREADTH: tuple[int, ...] = (5, 3)
+
+# Start tours for tsp_local_search, by name
+TOUR_CONSTRUCTIONS: dict[
+    str, Callable[[list[list[float]], list[list[int]]], list[int]]
+] = {
+    "greedy": _greedy_tour,
+    "nearest": _nearest_neighbor_tour,
+}
+
+# Candidate lists for tsp_lin_kernighan, by name
+CANDIDATE_SETS: dict[str, Callable[[list[list[float]], int], list[list[int]]]] = {
+    "alpha": _alpha_candidates,
+    "nearest": _candidate_lists,
+}
+
+# Default candidate list sizes: alpha-nearness ranks the edges of optimal
+# tours so well that 5 suffice, plain nearest neighbours need more
+CANDIDATE_COUNTS: dict[str, int] = {"alpha": 5, "nearest": 8}
+
+
+# =============================================================================
+# COORDINATE INSTANCES
+# =============================================================================
+
+
+# TSPLIB distance functions of the coordinate differences (dx, dy)
+TSPLIB_METRICS: dict[str, Callable[[float, float], float]] = {
+    "EUC_2D": lambda dx, dy: float(int(math.sqrt(dx * dx + dy * dy) + 0.5)),
+    "CEIL_2D": lambda dx, dy: float(math.ceil(math.sqrt(dx * dx + dy * dy))),
+    "ATT": lambda dx, dy: float(math.ceil(math.sqrt((dx * dx + dy * dy) / 10.0))),
+    # Not TSPLIB: unrounded, for generated instances
+    "EXACT_2D": lambda dx, dy: math.sqrt(dx * dx + dy * dy),
+}
+
+# Cities per KD-tree leaf
+_KD_LEAF_SIZE: int = 12
+
+
+class EuclideanInstance:
+    """
+    Cities as points in the plane, with distances computed on demand.
+
+    Indexing behaves like a distance matrix (instance[i][j], len, iteration
+    over rows), so every solver accepts it, but a row is only a view: no
+    n x n table is ever stored. Coordinates live in two array('d'), 16 bytes
+    per city. The heuristics take their candidate lists from a KD-tree
+    (neighbors) instead of scanning rows, and skip the symmetry check.
+    """
+
+    def __init__(
+        self,
+        xs: Iterable[float],
+        ys: Iterable[float],
+        metric: str = "EUC_2D",
+        name: str = "",
+    ) -> None:
+        if metric not in TSPLIB_METRICS:
+            raise ValueError(f"Unsupported distance metric: {metric!r}")
+        self.xs: array = array("d", xs)
+        self.ys: array = array("d", ys)
+        if len(self.xs) != len(self.ys):
+            raise ValueError("x and y coordinate counts differ")
+        self.metric: str = metric
+        self.name: str = name
+        self._distance: Callable[[float, float], float] = TSPLIB_METRICS[metric]
+
+    def __len__(self) -> int:
+        return len(self.xs)
+
+    def __getitem__(self, i: int) -> _DistanceRow:
+        return _DistanceRow(self, i)
+
+    def __iter__(self) -> Iterator[_DistanceRow]:
+        return (_DistanceRow(self, i) for i in range(len(self.xs)))
+
+    def distance(self, i: int, j: int) -> float:
+        """Distance between cities i and j under the instance metric."""
+        xs, ys = self.xs, self.ys
+        return self._distance(xs[i] - xs[j], ys[i] - ys[j])
+
+    def block(self, rows: range) -> Any:
+        """
+        Distances from each city in rows to every city, as one 2-D block.
+
+        Computed with NumPy in one vectorized pass when it is installed (a
+        len(rows) x n float64 array), else as a list of lists.
+        """
+        if np is None:
+            return [list(self[i]) for i in rows]
+        xs = np.frombuffer(self.xs, dtype=np.float64)
+        ys = np.frombuffer(self.ys, dtype=np.float64)
+        r = np.arange(rows.start, rows.stop, rows.step)
+        dx = xs[r, None] - xs
+        dy = ys[r, None] - ys
+        d2 = dx * dx + dy * dy
+        if self.metric == "EXACT_2D":
+            return np.sqrt(d2)
+        if self.metric == "EUC_2D":
+            return np.floor(np.sqrt(d2) + 0.5)
+        if self.metric == "CEIL_2D":
+            return np.ceil(np.sqrt(d2))
+        return np.ceil(np.sqrt(d2 / 10.0))
+
+    def to_matrix(self, block_size: int = 1024) -> list[list[float]]:
+        """Materialize the full matrix, block by block (small instances only)."""
+        n: int = len(self)
+        mat: list[list[float]] = []
+        for start in range(0, n, block_size):
+            rows = self.block(range(start, min(start + block_size, n)))
+            mat.extend(rows.tolist() if np is not None else rows)
+        return mat
+
+    def neighbors(self, k: int) -> list[list[int]]:
+        """
+        The k nearest other cities of each city, nearest first, via a KD-tree.
+
+        Every supported metric is non-decreasing in the Euclidean distance,
+        so the tree searches squared coordinate distances. O(n log n) on
+        spread-out points.
+        """
+        n: int = len(self)
+        k = min(k, n - 1)
+        if k <= 0:
+            return [[] for _ in range(n)]
+        xs, ys = self.xs, self.ys
+        tree: Any = _kd_build(xs, ys, list(range(n)))
+        # Cities of one leaf share a box query; the radius doubles until every
+        # city has k neighbours inside it, and so none outside can be nearer
+        spread: float = max(max(xs) - min(xs), max(ys) - min(ys), 1e-9)
+        fallback: float = spread * math.sqrt(k / n)
+        lists: list[list[int]] = [[] for _ in range(n)]
+        for leaf in _kd_leaves(tree):
+            x0, x1 = min(map(xs.__getitem__, leaf)), max(map(xs.__getitem__, leaf))
+            y0, y1 = min(map(ys.__getitem__, leaf)), max(map(ys.__getitem__, leaf))
+            radius: float = math.sqrt((x1 - x0) * (y1 - y0) * k / len(leaf))
+            radius = radius or fallback
+            todo: list[int] = leaf
+            while todo:
+                box: list[int] = _kd_range(
+                    tree, x0 - radius, x1 + radius, y0 - radius, y1 + radius
+                )
+                limit: float = radius * radius
+                missing: list[int] = []
+                for city, (reach, nearest) in zip(
+                    todo, _box_nearest(xs, ys, sorted(box), todo, k)
+                ):
+                    if reach <= limit:
+                        lists[city] = nearest
+                    else:
+                        missing.append(city)
+                todo = missing
+                radius *= 2
+        return lists
+
+
+class _DistanceRow:
+    """Row i of an EuclideanInstance: distances from city i, computed lazily."""
+
+    __slots__ = ("_xs", "_ys", "_x", "_y", "_distance")
+
+    def __init__(self, instance: EuclideanInstance, i: int) -> None:
+        self._xs: array = instance.xs
+        self._ys: array = instance.ys
+        self._x: float = instance.xs[i]
+        self._y: float = instance.ys[i]
+        self._distance: Callable[[float, float], float] = instance._distance
+
+    def __getitem__(self, j: int) -> float:
+        return self._distance(self._x - self._xs[j], self._y - self._ys[j])
+
+    def __len__(self) -> int:
+        return len(self._xs)
+
+    def __iter__(self) -> Iterator[float]:
+        x, y, distance = self._x, self._y, self._distance
+        return (distance(x - a, y - b) for a, b in zip(self._xs, self._ys))
+
+
+def _kd_build(xs: array, ys: array, cities: list[int]) -> Any:
+    """KD-tree over cities: a leaf is a list, a split is (axis, value, low, high)."""
+    if len(cities) <= _KD_LEAF_SIZE:
+        return cities
+    xspan: float = max(map(xs.__getitem__, cities)) - min(map(xs.__getitem__, cities))
+    yspan: float = max(map(ys.__getitem__, cities)) - min(map(ys.__getitem__, cities))
+    axis: int = 0 if xspan >= yspan else 1  # Split the wider side
+    coords: array = ys if axis else xs
+    cities.sort(key=coords.__getitem__)
+    mid: int = len(cities) // 2
+    return (
+        axis,
+        coords[cities[mid]],
+        _kd_build(xs, ys, cities[:mid]),
+        _kd_build(xs, ys, cities[mid:]),
+    )
+
+
+def _box_nearest(
+    xs: array, ys: array, box: list[int], cities: list[int], k: int
+) -> list[tuple[float, list[int]]]:
+    """
+    For each city, its k nearest in box (sorted, itself excluded) and the
+    squared distance of the k-th, inf if box is too small. Ties go to the
+    lower city number. Vectorized over the whole batch when NumPy is
+    installed.
+    """
+    inf: float = float("inf")
+    if len(box) <= k:
+        return [(inf, []) for _ in cities]
+    if np is None:
+        bx: list[float] = [xs[c] for c in box]
+        by: list[float] = [ys[c] for c in box]
+        result: list[tuple[float, list[int]]] = []
+        for city in cities:
+            qx, qy = xs[city], ys[city]
+            d2 = [(x - qx) ** 2 + (y - qy) ** 2 for x, y in zip(bx, by)]
+            found = [f for f in heapq.nsmallest(k + 1, zip(d2, box)) if f[1] != city]
+            result.append((found[k - 1][0], [c for _, c in found[:k]]))
+        return result
+    x = np.frombuffer(xs, dtype=np.float64)
+    y = np.frombuffer(ys, dtype=np.float64)
+    b = np.array(box)
+    q = np.array(cities)
+    dx = x[q, None] - x[b]
+    dy = y[q, None] - y[b]
+    d2 = dx * dx + dy * dy
+    d2[q[:, None] == b] = inf
+    order = np.argsort(d2, axis=1, kind="stable")[:, :k]
+    reach = np.take_along_axis(d2, order[:, -1:], axis=1)[:, 0]
+    return list(zip(reach.tolist(), b[order].tolist()))
+
+
+def _kd_leaves(tree: Any) -> Iterator[list[int]]:
+    """The leaves of a KD-tree, left to right."""
+    stack: list[Any] = [tree]
+    while stack:
+        node = stack.pop()
+        if isinstance(node, list):
+            yield node
+        else:
+            stack += (node[3], node[2])
+
+
+def _kd_range(tree: Any, x0: float, x1: float, y0: float, y1: float) -> list[int]:
+    """Cities of a KD-tree whose coordinates may lie in [x0, x1] x [y0, y1]."""
+    found: list[int] = []
+    stack: list[Any] = [tree]
+    while stack:
+        node = stack.pop()
+        if isinstance(node, list):
+            found += node
+            continue
+        axis, value, low, high = node
+        lo, hi = (x0, x1) if axis == 0 else (y0, y1)
+        if lo <= value:
+            stack.append(low)
+        if hi >= value:
+            stack.append(high)
+    return found
+
+
+def load_tsplib(path: str) -> EuclideanInstance:
+    """
+    Read a coordinate TSPLIB .tsp file, streaming it line by line.
+
+    Supports EDGE_WEIGHT_TYPE EUC_2D, CEIL_2D and ATT with a
+    NODE_COORD_SECTION; cities are numbered 0..n-1 in file order.
+
+    Args:
+        path: Path of the .tsp file
+
+    Returns:
+        The instance, named after the NAME field
+
+    Raises:
+        ValueError: If the file is malformed or uses another weight type
+    """
+    header: dict[str, str] = {}
+    xs: array = array("d")
+    ys: array = array("d")
+    with open(path, encoding="utf-8") as f:
+        lines: Iterator[str] = iter(f)
+        for line in lines:
+            line = line.strip()
+            if not line:
+                continue
+            if line.startswith("NODE_COORD_SECTION"):
+                break
+            if line == "EOF":
+                break
+            key, sep, value = line.partition(":")
+            if not sep:
+                raise ValueError(f"Unexpected TSPLIB line: {line!r}")
+            header[key.strip().upper()] = value.strip()
+
+        metric: str = header.get("EDGE_WEIGHT_TYPE", "")
+        if metric not in TSPLIB_METRICS or metric == "EXACT_2D":
+            raise ValueError(f"Unsupported EDGE_WEIGHT_TYPE: {metric or None!r}")
+
+        for line in lines:
+            fields: list[str] = line.split()
+            if not fields:
+                continue
+            if fields[0] == "EOF" or not fields[0][0].isdigit():
+                break
+            if len(fields) < 3:
+                raise ValueError(f"Bad coordinate line: {line.strip()!r}")
+            xs.append(float(fields[1]))
+            ys.append(float(fields[2]))
+
+    dimension: str | None = header.get("DIMENSION")
+    if dimension is not None and int(dimension) != len(xs):
+        raise ValueError(f"DIMENSION is {dimension} but {len(xs)} cities were read")
+    return EuclideanInstance(xs, ys, metric, header.get("NAME", ""))
+
+
 # =============================================================================
 # UTILITIES
 # =============================================================================
@@ -173,6 +1886,18 @@ def generate_random_graph(
     return mat
 
 
+def generate_random_points(
+    n: int, size: float = 1000.0, metric: str = "EUC_2D"
+) -> EuclideanInstance:
+    """Generate n uniformly random cities in a size x size square."""
+    return EuclideanInstance(
+        (random.uniform(0, size) for _ in range(n)),
+        (random.uniform(0, size) for _ in range(n)),
+        metric,
+        f"random{n}",
+    )
+
+
 def matrix_to_string(mat: list[list[float]]) -> str:
     """Convert distance matrix to formatted string."""
     if not mat:
@@ -205,6 +1930,12 @@ class TSPApplication:
     """Enhanced TSP Solver GUI with improved ergonomics."""
 
     MAX_GRID_SIZE: int = 15
+    MAX_CITIES: int = 80
+    MAX_HELD_KARP_CITIES: int = 20
+    MAX_EXACT_CITIES: int = 14
+    LK_TIME_LIMIT: float = 1.0
+    BB_TIME_LIMIT: float = 5.0
+    TSPLIB_TIME_LIMIT: float = 30.0
 
     def __init__(self, root: tk.Tk) -> None:
         self.root: tk.Tk = root
@@ -214,6 +1945,9 @@ class TSPApplication:
         # Variables
         self.n_var: tk.StringVar = tk.StringVar(value="6")
         self.symmetric_var: tk.BooleanVar = tk.BooleanVar(value=True)
+        self.engine_var: tk.StringVar = tk.StringVar(
+            value="NumPy" if "NumPy" in HELD_KARP_ENGINES else "Pure Python"
+        )
         self.entries: list[list[tk.Entry]] = []
         self.current_matrix: list[list[float]] = []
 
@@ -234,7 +1968,7 @@ class TSPApplication:
 
         ttk.Label(size_frame, text="Number of cities (n):").pack(side=tk.LEFT, padx=5)
         size_spinbox: ttk.Spinbox = ttk.Spinbox(
-            size_frame, from_=3, to=20, textvariable=self.n_var, width=5
+            size_frame, from_=3, to=self.MAX_CITIES, textvariable=self.n_var, width=5
         )
         size_spinbox.pack(side=tk.LEFT, padx=5)
 
@@ -242,6 +1976,15 @@ class TSPApplication:
             size_frame, text="Symmetric (undirected)", variable=self.symmetric_var
         ).pack(side=tk.LEFT, padx=20)
 
+        ttk.Label(size_frame, text="Held-Karp engine:").pack(side=tk.LEFT, padx=5)
+        ttk.Combobox(
+            size_frame,
+            textvariable=self.engine_var,
+            values=list(HELD_KARP_ENGINES),
+            state="readonly",
+            width=12,
+        ).pack(side=tk.LEFT, padx=5)
+
         # Buttons
         button_frame: tk.Frame = tk.Frame(control_frame)
         button_frame.pack(fill=tk.X, pady=5)
@@ -258,6 +2001,9 @@ class TSPApplication:
         ttk.Button(button_frame, text="📊 Benchmark", command=self.run_benchmark).pack(
             side=tk.LEFT, padx=5
         )
+        ttk.Button(
+            button_frame, text="📂 Load TSPLIB", command=self.load_tsplib_file
+        ).pack(side=tk.LEFT, padx=5)
         ttk.Button(
             button_frame, text="🗑️ Clear Results", command=self.clear_results
         ).pack(side=tk.LEFT, padx=5)
@@ -319,8 +2065,8 @@ class TSPApplication:
             messagebox.showerror("Error", "Please enter a valid integer for n")
             return
 
-        if n < 3 or n > 20:
-            messagebox.showerror("Error", "n must be between 3 and 20")
+        if n < 3 or n > self.MAX_CITIES:
+            messagebox.showerror("Error", f"n must be between 3 and {self.MAX_CITIES}")
             return
 
         # Clear previous grid
@@ -406,7 +2152,7 @@ class TSPApplication:
         )
 
     def run_algorithms(self) -> None:
-        """Run both TSP algorithms and display results."""
+        """Run the TSP algorithms that fit this n and display results."""
         try:
             n: int = int(self.n_var.get())
         except ValueError:
@@ -429,38 +2175,128 @@ class TSPApplication:
             self.results_text.insert(tk.END, "Distance Matrix:\n")
             self.results_text.insert(tk.END, matrix_to_string(mat) + "\n\n")
 
-        # Run Bellman-Held-Karp
-        self.status_var.set("Running Bellman-Held-Karp...")
+        # Run Bellman-Held-Karp (exponential memory: small n only)
+        hk_time: float = 0.0
+        if n <= self.MAX_HELD_KARP_CITIES:
+            self.status_var.set("Running Bellman-Held-Karp...")
+            self.root.update()
+
+            engine: str = self.engine_var.get()
+            t_start: float = time.perf_counter()
+            hk_cost, hk_path = HELD_KARP_ENGINES[engine](mat)
+            t_end: float = time.perf_counter()
+            hk_time = t_end - t_start
+
+            self.results_text.insert(
+                tk.END, f"BELLMAN-HELD-KARP (Dynamic Programming, {engine})\n"
+            )
+            self.results_text.insert(tk.END, f"  Cost: {hk_cost:.2f}\n")
+            self.results_text.insert(
+                tk.END, f"  Path: {' → '.join(map(str, hk_path))}\n"
+            )
+            self.results_text.insert(tk.END, f"  Time: {hk_time:.6f} seconds\n")
+            self.results_text.insert(tk.END, f"  Complexity: O(n² × 2ⁿ)\n\n")
+        else:
+            self.results_text.insert(
+                tk.END,
+                f"BELLMAN-HELD-KARP: Skipped (n > {self.MAX_HELD_KARP_CITIES}, "
+                "memory wall)\n\n",
+            )
+
+        # Run Branch-and-bound (symmetric matrices only)
+        self.status_var.set("Running Branch-and-Bound...")
         self.root.update()
+        try:
+            t_start = time.perf_counter()
+            bb_stats: dict[str, Any] = {}
+            bb_cost, bb_path = tsp_branch_and_bound(
+                mat, time_limit=self.BB_TIME_LIMIT, stats=bb_stats
+            )
+            t_end = time.perf_counter()
+        except ValueError:
+            self.results_text.insert(
+                tk.END, "BRANCH-AND-BOUND: Skipped (asymmetric matrix)\n\n"
+            )
+        else:
+            self.results_text.insert(
+                tk.END, "BRANCH-AND-BOUND (1-tree / Held-Karp bounds)\n"
+            )
+            self.results_text.insert(tk.END, f"  Cost: {bb_cost:.2f}\n")
+            if not bb_stats["proven"]:
+                self.results_text.insert(
+                    tk.END,
+                    f"  Not proven optimal (stopped after {self.BB_TIME_LIMIT:g} s)\n",
+                )
+            self.results_text.insert(
+                tk.END, f"  Path: {' → '.join(map(str, bb_path))}\n"
+            )
+            self.results_text.insert(
+                tk.END, f"  Time: {t_end - t_start:.6f} seconds\n\n"
+            )
 
-        t_start: float = time.perf_counter()
-        hk_cost, hk_path = tsp_held_karp(mat)
-        t_end: float = time.perf_counter()
-        hk_time: float = t_end - t_start
+        # Run local search (heuristic, symmetric matrices only)
+        self.status_var.set("Running Local Search...")
+        self.root.update()
+        try:
+            t_start = time.perf_counter()
+            ls_cost, ls_path = tsp_local_search(mat)
+            t_end = time.perf_counter()
+        except ValueError:
+            self.results_text.insert(
+                tk.END, "LOCAL SEARCH: Skipped (asymmetric matrix)\n\n"
+            )
+        else:
+            self.results_text.insert(
+                tk.END, "LOCAL SEARCH (Greedy + 2-opt/Or-opt, heuristic)\n"
+            )
+            self.results_text.insert(tk.END, f"  Cost: {ls_cost:.2f}\n")
+            self.results_text.insert(
+                tk.END, f"  Path: {' → '.join(map(str, ls_path))}\n"
+            )
+            self.results_text.insert(
+                tk.END, f"  Time: {t_end - t_start:.6f} seconds\n\n"
+            )
 
-        self.results_text.insert(tk.END, "BELLMAN-HELD-KARP (Dynamic Programming)\n")
-        self.results_text.insert(tk.END, f"  Cost: {hk_cost:.2f}\n")
-        self.results_text.insert(tk.END, f"  Path: {' → '.join(map(str, hk_path))}\n")
-        self.results_text.insert(tk.END, f"  Time: {hk_time:.6f} seconds\n")
-        self.results_text.insert(tk.END, f"  Complexity: O(n² × 2ⁿ)\n\n")
+        # Run iterated Lin-Kernighan (heuristic, fixed time budget)
+        self.status_var.set("Running Lin-Kernighan...")
+        self.root.update()
+        try:
+            t_start = time.perf_counter()
+            lk_cost, lk_path = tsp_lin_kernighan(mat, time_limit=self.LK_TIME_LIMIT)
+            t_end = time.perf_counter()
+        except ValueError:
+            self.results_text.insert(
+                tk.END, "LIN-KERNIGHAN: Skipped (asymmetric matrix)\n\n"
+            )
+        else:
+            self.results_text.insert(
+                tk.END, "LIN-KERNIGHAN (Iterated, double-bridge kicks, heuristic)\n"
+            )
+            self.results_text.insert(tk.END, f"  Cost: {lk_cost:.2f}\n")
+            self.results_text.insert(
+                tk.END, f"  Path: {' → '.join(map(str, lk_path))}\n"
+            )
+            self.results_text.insert(
+                tk.END, f"  Time: {t_end - t_start:.6f} seconds\n\n"
+            )
 
         # Run Exact enumeration (only for small n)
-        if n <= 10:
+        if n <= self.MAX_EXACT_CITIES:
             self.status_var.set("Running Exact Enumeration...")
             self.root.update()
 
             t_start = time.perf_counter()
-            ex_cost, ex_path = tsp_exact(mat)
+            ex_cost, ex_path = tsp_exact_dfs(mat)
             t_end = time.perf_counter()
             ex_time: float = t_end - t_start
 
-            self.results_text.insert(tk.END, "EXACT ENUMERATION (Brute Force)\n")
+            self.results_text.insert(tk.END, "EXACT ENUMERATION (Pruned DFS)\n")
             self.results_text.insert(tk.END, f"  Cost: {ex_cost:.2f}\n")
             self.results_text.insert(
                 tk.END, f"  Path: {' → '.join(map(str, ex_path))}\n"
             )
             self.results_text.insert(tk.END, f"  Time: {ex_time:.6f} seconds\n")
-            self.results_text.insert(tk.END, f"  Complexity: O(n!)\n\n")
+            self.results_text.insert(tk.END, f"  Complexity: O(n!) worst case\n\n")
 
             # Comparison
             speedup: float = ex_time / hk_time if hk_time > 0 else 0
@@ -469,7 +2305,8 @@ class TSPApplication:
             )
         else:
             self.results_text.insert(
-                tk.END, "EXACT ENUMERATION: Skipped (n > 10, too slow)\n"
+                tk.END,
+                f"EXACT ENUMERATION: Skipped (n > {self.MAX_EXACT_CITIES}, too slow)\n",
             )
 
         self.results_text.see(tk.END)
@@ -478,7 +2315,11 @@ class TSPApplication:
     def run_benchmark(self) -> None:
         """Run benchmark comparing both algorithms."""
         self.results_text.insert(tk.END, "\n" + "=" * 70 + "\n")
-        self.results_text.insert(tk.END, "BENCHMARK: Symmetric Random Graphs\n")
+        engine: str = self.engine_var.get()
+        held_karp = HELD_KARP_ENGINES[engine]
+        self.results_text.insert(
+            tk.END, f"BENCHMARK: Symmetric Random Graphs (Held-Karp: {engine})\n"
+        )
         self.results_text.insert(tk.END, "=" * 70 + "\n\n")
         self.results_text.insert(
             tk.END, f"{'n':<5}{'Held-Karp (s)':<20}{'Exact (s)':<20}{'Speedup':<10}\n"
@@ -490,14 +2331,14 @@ class TSPApplication:
 
             # Bellman-Held-Karp
             t0: float = time.perf_counter()
-            _, _ = tsp_held_karp(mat)
+            _, _ = held_karp(mat)
             t1: float = time.perf_counter()
             hk_time: float = t1 - t0
 
-            # Exact (only up to n=10)
-            if n <= 10:
+            # Exact (pruned enumeration)
+            if n <= self.MAX_EXACT_CITIES:
                 t2: float = time.perf_counter()
-                _, _ = tsp_exact(mat)
+                _, _ = tsp_exact_dfs(mat)
                 t3: float = time.perf_counter()
                 ex_time: float = t3 - t2
                 speedup: float = ex_time / hk_time if hk_time > 0 else 0
@@ -516,6 +2357,63 @@ class TSPApplication:
         self.results_text.insert(tk.END, "\n✅ Benchmark complete!\n")
         self.status_var.set("Benchmark completed")
 
+    def load_tsplib_file(self) -> None:
+        """Load a TSPLIB coordinate instance and run the heuristics on it."""
+        path: str = filedialog.askopenfilename(
+            title="Open TSPLIB instance",
+            filetypes=[("TSPLIB instances", "*.tsp"), ("All files", "*.*")],
+        )
+        if not path:
+            return
+        self.status_var.set(f"Loading {os.path.basename(path)}...")
+        self.root.update()
+        try:
+            instance: EuclideanInstance = load_tsplib(path)
+        except (OSError, ValueError) as e:
+            messagebox.showerror("Error", f"Cannot load {path}:\n{e}")
+            self.status_var.set("Load failed")
+            return
+
+        n: int = len(instance)
+        self.results_text.insert(tk.END, "\n" + "=" * 70 + "\n")
+        self.results_text.insert(
+            tk.END,
+            f"TSPLIB INSTANCE {instance.name or os.path.basename(path)}: "
+            f"{n} cities, {instance.metric}\n",
+        )
+        self.results_text.insert(tk.END, "=" * 70 + "\n\n")
+
+        solvers: list[tuple[str, str, Callable[[], tuple[float, list[int]]]]] = [
+            (
+                "Local Search",
+                "LOCAL SEARCH (Greedy + 2-opt/Or-opt, heuristic)",
+                lambda: tsp_local_search(instance, self.TSPLIB_TIME_LIMIT),
+            ),
+            (
+                "Lin-Kernighan",
+                "LIN-KERNIGHAN (Iterated, double-bridge kicks, heuristic)",
+                lambda: tsp_lin_kernighan(instance, self.TSPLIB_TIME_LIMIT),
+            ),
+        ]
+        for label, title, solve in solvers:
+            self.status_var.set(f"Running {label}...")
+            self.root.update()
+            t_start: float = time.perf_counter()
+            cost, tour = solve()
+            t_end: float = time.perf_counter()
+            self.results_text.insert(tk.END, f"{title}\n")
+            self.results_text.insert(tk.END, f"  Cost: {cost:.2f}\n")
+            if n <= self.MAX_CITIES:
+                self.results_text.insert(
+                    tk.END, f"  Path: {' → '.join(map(str, tour))}\n"
+                )
+            self.results_text.insert(
+                tk.END, f"  Time: {t_end - t_start:.6f} seconds\n\n"
+            )
+            self.results_text.see(tk.END)
+
+        self.status_var.set(f"TSPLIB instance solved (n={n})")
+
     def clear_results(self) -> None:
         """Clear the results text area."""
         self.results_text.delete(1.0, tk.END)